@@ -12,7 +12,8 @@ async_database_url = settings.database_url.replace("postgresql://", "postgresql+
 engine = create_async_engine(
     async_database_url,
     echo=False,
-    pool_pre_ping=True,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_recycle=settings.db_pool_recycle,
     pool_size=10,
     max_overflow=20
 )
@@ -21,7 +22,8 @@ engine = create_async_engine(
 sync_engine = create_engine(
     settings.database_url,
     echo=False,
-    pool_pre_ping=True
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_recycle=settings.db_pool_recycle
 )
 
 # Create async session factory
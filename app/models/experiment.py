@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, JSON, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, JSON, Enum, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -52,7 +52,7 @@ class Experiment(Base):
 class ExperimentRun(Base):
     __tablename__ = "experiment_runs"
     
-    id = Column(Text, primary_key=True, unique=True, index=True)
+    id = Column(Text, primary_key=True, unique=True, index=True, server_default=text("gen_random_uuid()::text"))
     status = Column(Enum(RunStatus), default=RunStatus.PENDING)
     
     # Results
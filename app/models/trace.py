@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, JSON, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, JSON, Float, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -8,7 +8,10 @@ class Trace(Base):
     __tablename__ = "traces"
     
     id = Column(Integer, primary_key=True, index=True)
-    trace_id = Column(String(100), unique=True, index=True, nullable=False)
+    trace_id = Column(
+        String(100), unique=True, index=True, nullable=False,
+        server_default=text("'trace-' || substr(md5(random()::text), 1, 8)")
+    )
     
     # Request/Response data
     prompt_id = Column(Integer, ForeignKey("prompts.id"), nullable=False)
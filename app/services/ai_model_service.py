@@ -1,5 +1,6 @@
 import asyncio
 import time
+from contextlib import asynccontextmanager
 import httpx
 from typing import Dict, Any, Optional
 from app.config import settings
@@ -8,9 +9,20 @@ import pdb
 class AIModelService:
     """Service for calling different AI model providers"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         self.openai_api_key = settings.openai_api_key if hasattr(settings, 'openai_api_key') else None
         self.anthropic_api_key = settings.anthropic_api_key if hasattr(settings, 'anthropic_api_key') else None
+        # A caller-owned client keeps provider connections alive across calls
+        self.http_client = http_client
+    
+    @asynccontextmanager
+    async def _client(self):
+        """Yield the shared HTTP client, or a throwaway one when none was given"""
+        if self.http_client is not None:
+            yield self.http_client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
     
     async def call_model(self, prompt_config: Dict[str, Any], input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Call AI model with the given configuration"""
@@ -63,7 +75,7 @@ class AIModelService:
         temperature = config.get("temperature", 0.7)
         max_tokens = config.get("max_tokens", 1000)
         
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             response = await client.post(
                 "https://api.openai.com/v1/chat/completions",
                 headers={"Authorization": f"Bearer {self.openai_api_key}"},
@@ -99,7 +111,7 @@ class AIModelService:
         
         max_tokens = config.get("max_tokens", 1000)
         
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             response = await client.post(
                 "https://api.anthropic.com/v1/messages",
                 headers={
@@ -1,8 +1,10 @@
 import asyncio
 import json
 import time
+import httpx
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from itertools import islice
+from typing import Dict, Any, Iterable, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from sqlalchemy.orm import selectinload
@@ -12,30 +14,61 @@ from app.models.evaluation import EvaluationResult
 from app.models.dataset import DatasetItem
 from app.services.redis_queue import RedisQueue
 from app.services.evaluator_framework import EvaluatorFramework
+from app.services.evaluator_service import evaluator_service
 from app.services.ai_model_service import AIModelService
 
 
 class EvaluationWorker:
     """Main evaluation worker that processes jobs from Redis queue"""
     
-    def __init__(self, db: AsyncSession):
+    # Max jobs fetched from Redis per dequeue round trip
+    dequeue_batch_size = 32
+    
+    def __init__(self, db: AsyncSession, redis_client=None):
         self.db = db
-        self.redis_queue = RedisQueue()
+        # Reuse the caller's Redis client (and its pool) when one is given
+        self.redis_queue = RedisQueue(redis_client=redis_client)
         self.evaluator_framework = EvaluatorFramework()
+        # One pooled HTTP client for model calls, opened by __aenter__/start and kept
+        # warm until __aexit__/stop
+        self._http: Optional[httpx.AsyncClient] = None
         self.ai_model_service = AIModelService()
         self.running = False
     
+    async def __aenter__(self):
+        self._open_http()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._close_http()
+    
+    def _open_http(self):
+        """Create the pooled HTTP client and hand it to the model service, once"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(limits=httpx.Limits(max_connections=50, max_keepalive_connections=25))
+            self.ai_model_service.http_client = self._http
+    
+    async def _close_http(self):
+        """Close the pooled HTTP client if it is open; safe to call more than once"""
+        if self._http is not None:
+            client, self._http = self._http, None
+            self.ai_model_service.http_client = None
+            await client.aclose()
+    
     async def start(self):
         """Start the worker loop"""
+        self._open_http()
         self.running = True
         print("Evaluation worker started")
         
         while self.running:
             try:
-                # Dequeue job
-                job_data = await self.redis_queue.dequeue_job()
-                if job_data:
-                    await self.process_evaluation_job(job_data)
+                # Pull up to a batch of jobs per round trip; they are processed
+                # in order since they all share the worker's DB session
+                jobs = await self.redis_queue.dequeue_jobs(self.dequeue_batch_size)
+                if jobs:
+                    for job_data in jobs:
+                        await self.process_evaluation_job(job_data)
                 else:
                     # No jobs, wait a bit
                     await asyncio.sleep(1)
@@ -48,6 +81,7 @@ class EvaluationWorker:
         """Stop the worker"""
         self.running = False
         await self.redis_queue.close()
+        await self._close_http()
     
     async def process_evaluation_job(self, job_data: Dict[str, Any]):
         """Process a single evaluation job"""
@@ -67,7 +101,9 @@ class EvaluationWorker:
             await self._update_run_status(run.id, RunStatus.RUNNING)
             
             # Process dataset items
-            dataset_ids = json.loads(job_data["dataset_ids"])
+            dataset_ids = job_data["dataset_ids"]
+            if isinstance(dataset_ids, str):
+                dataset_ids = json.loads(dataset_ids)
             dataset_items = await self._get_dataset_items(dataset_ids)
             total_items = len(dataset_items)
             
@@ -98,14 +134,13 @@ class EvaluationWorker:
             
             print(f"Job {job_id} completed successfully")
 
-            # Get evaluation results for completed job
-            evaluation_results = []
-            async with self.db as session:
-                results_query = select(EvaluationResult).where(
-                    EvaluationResult.experiment_run_id == experiment_run_id
-                )
-                results = await session.execute(results_query)
-                evaluation_results = results.scalars().all()
+            # Get evaluation results for completed job on the worker's own session
+            # (re-entering it as a context manager would close it underneath the worker)
+            results_query = select(EvaluationResult).where(
+                EvaluationResult.experiment_run_id == experiment_run_id
+            )
+            results = await self.db.execute(results_query)
+            evaluation_results = results.scalars().all()
             
             return {
                 "status": "completed",
@@ -127,10 +162,46 @@ class EvaluationWorker:
                 "error": str(e)
             }
     
-    def _batch_items(self, items: List[Dict[str, Any]], batch_size: int):
-        """Split items into batches"""
-        for i in range(0, len(items), batch_size):
-            yield items[i:i + batch_size]
+    async def process_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluate a job's inline test cases against its evaluators.
+        
+        test_cases may be any iterable (e.g. a generator); it is consumed once,
+        a batch at a time, so the full set never has to be materialized up front.
+        """
+        job_id = job_data.get("job_id")
+        
+        evaluator_configs = job_data.get("evaluator_configs", [])
+        if isinstance(evaluator_configs, str):
+            evaluator_configs = json.loads(evaluator_configs)
+        test_cases = job_data.get("test_cases", [])
+        if isinstance(test_cases, str):
+            test_cases = json.loads(test_cases)
+        
+        # Reject unknown evaluators before touching any test case
+        available = set(evaluator_service.get_available_evaluators())
+        unknown = [c.get("evaluator_type") for c in evaluator_configs if c.get("evaluator_type") not in available]
+        if unknown:
+            print(f"Job {job_id} failed: unknown evaluator(s) {unknown}")
+            return {
+                "status": "failed",
+                "error": f"Unknown evaluator type(s): {', '.join(map(str, unknown))}"
+            }
+        
+        batch_size = job_data.get("execution_config", {}).get("parallel_workers", 5)
+        results = []
+        for batch in self._batch_items(test_cases, batch_size):
+            results.extend(await evaluator_service.evaluate_batch(evaluator_configs, batch))
+        
+        return {
+            "status": "completed",
+            "results": results,
+        }
+    
+    def _batch_items(self, items: Iterable[Dict[str, Any]], batch_size: int):
+        """Split items into batches, consuming any iterable once"""
+        iterator = iter(items)
+        while batch := list(islice(iterator, batch_size)):
+            yield batch
     
     async def _process_batch(self, items: List[Dict[str, Any]], job_data: Dict[str, Any]) -> List[EvaluationResult]:
         """Process a batch of items concurrently"""
@@ -173,10 +244,9 @@ class EvaluationWorker:
         execution_time_ms = model_result["execution_time_ms"]
         cost_usd = model_result["cost_usd"]
         
-        # Run evaluators
-        scores = {}
-        for evaluator_config in evaluators:
-            evaluator_result = await self.evaluator_framework.run_evaluator(
+        # Run evaluators concurrently; item concurrency is already bounded by the batch size
+        evaluator_results = await asyncio.gather(*(
+            self.evaluator_framework.run_evaluator(
                 evaluator_config,
                 input_data,
                 expected_output,
@@ -184,7 +254,12 @@ class EvaluationWorker:
                 execution_time_ms,
                 cost_usd
             )
-            scores[evaluator_config["name"]] = evaluator_result
+            for evaluator_config in evaluators
+        ))
+        scores = {
+            evaluator_config["name"]: evaluator_result
+            for evaluator_config, evaluator_result in zip(evaluators, evaluator_results)
+        }
         
         # Create evaluation result
         result = EvaluationResult(
@@ -200,10 +275,10 @@ class EvaluationWorker:
             created_at=datetime.utcnow()
         )
         
-        # Save to database
+        # Save to database without a refresh: RETURNING fills in only the PK, and no
+        # server default is read back since created_at (the one there is) is set above
         self.db.add(result)
         await self.db.commit()
-        await self.db.refresh(result)
         
         return result
     
@@ -225,7 +300,6 @@ class EvaluationWorker:
         
         self.db.add(result)
         await self.db.commit()
-        await self.db.refresh(result)
         
         return result
     
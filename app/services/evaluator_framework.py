@@ -109,11 +109,9 @@ async def semantic_similarity_evaluator(input_data: Dict[str, Any],
         framework = EvaluatorFramework()
         model = framework._get_sentence_model()
         
-        # Compute embeddings
-        embeddings = model.encode([expected_output, actual_output])
-        similarity = np.dot(embeddings[0], embeddings[1]) / (
-            np.linalg.norm(embeddings[0]) * np.linalg.norm(embeddings[1])
-        )
+        # Compute normalized embeddings so cosine similarity is a dot product
+        embeddings = model.encode([expected_output, actual_output], normalize_embeddings=True)
+        similarity = np.dot(embeddings[0], embeddings[1])
         
         return {
             "score": float(similarity),
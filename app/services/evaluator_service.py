@@ -1,6 +1,9 @@
 from typing import Dict, Any, List, Optional, Callable, Type
 from abc import ABC, abstractmethod
 import asyncio
+import functools
+from collections import OrderedDict
+import json
 import logging
 from datetime import datetime
 
@@ -8,6 +11,14 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared fields of every failed evaluation result
+_ERR_TEMPLATE = {"score": 0.0, "passed": False}
+
+
+def _error_result(evaluator_type: str, error: str) -> Dict[str, Any]:
+    """Build a failed evaluation result from the shared error template"""
+    return {**_ERR_TEMPLATE, "evaluator_type": evaluator_type, "error": error}
+
 
 class BaseEvaluator(ABC):
     """Base class for all evaluators"""
@@ -24,11 +35,38 @@ class BaseEvaluator(ABC):
         """Evaluate the actual output against expected output"""
         pass
     
+    async def evaluate_many(self, test_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Evaluate a list of test cases, one result per case in order.
+        
+        Falls back to calling evaluate() per case; evaluators with a cheaper
+        batched path override this.
+        """
+        results = []
+        for test_case in test_cases:
+            try:
+                result = await self.evaluate(**_test_case_kwargs(test_case))
+            except Exception as e:
+                logger.error("%s error: %s", self.name, e)
+                result = _error_result(self.name, str(e))
+            results.append(result)
+        return results
+    
     def validate_config(self) -> bool:
         """Validate evaluator configuration"""
         return True
 
 
+def _test_case_kwargs(test_case: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a test case dict onto BaseEvaluator.evaluate keyword arguments"""
+    return {
+        "expected_output": test_case.get("expected_output", ""),
+        "actual_output": test_case.get("actual_output", ""),
+        "input_data": test_case.get("input"),
+        "execution_time_ms": test_case.get("latency_ms"),
+        "cost_usd": test_case.get("cost_usd")
+    }
+
+
 class ExactMatchEvaluator(BaseEvaluator):
     """Exact string match evaluator"""
     
@@ -36,7 +74,7 @@ class ExactMatchEvaluator(BaseEvaluator):
         required_fields = []
         for field in required_fields:
             if field not in self.config:
-                logger.error(f"Missing required field '{field}' in ExactMatchEvaluator config")
+                logger.error("Missing required field '%s' in ExactMatchEvaluator config", field)
                 return False
         return True
     
@@ -76,21 +114,76 @@ class ExactMatchEvaluator(BaseEvaluator):
                 }
             }
         except Exception as e:
-            logger.error(f"ExactMatchEvaluator error: {e}")
-            return {
+            logger.error("ExactMatchEvaluator error: %s", e)
+            return _error_result("exact_match", str(e))
+
+    async def evaluate_many(self, test_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Compare all test cases in one pass instead of awaiting evaluate() per case"""
+        case_sensitive = self.config.get("case_sensitive", False)
+        strip_whitespace = self.config.get("strip_whitespace", True)
+
+        try:
+            expected_raw = [tc.get("expected_output", "") for tc in test_cases]
+            actual_raw = [tc.get("actual_output", "") for tc in test_cases]
+            expected = [s.strip() for s in expected_raw] if strip_whitespace else expected_raw
+            actual = [s.strip() for s in actual_raw] if strip_whitespace else actual_raw
+            if not case_sensitive:
+                expected = [s.lower() for s in expected]
+                actual = [s.lower() for s in actual]
+            matches = [a == e for a, e in zip(actual, expected)]
+        except Exception:
+            # A malformed case (e.g. a non-string output) gets its own error result
+            return await super().evaluate_many(test_cases)
+
+        return [
+            {
                 "evaluator_type": "exact_match",
-                "score": 0.0,
-                "passed": False,
-                "error": str(e)
+                "score": 1.0 if is_match else 0.0,
+                "passed": is_match,
+                "details": {
+                    "case_sensitive": case_sensitive,
+                    "strip_whitespace": strip_whitespace,
+                    "expected": e.strip(),
+                    "actual": a.strip(),
+                    "matched": is_match
+                }
             }
+            for e, a, is_match in zip(expected_raw, actual_raw, matches)
+        ]
+
+
+@functools.lru_cache(maxsize=4)
+def _load_sentence_model(max_seq_length: int, quantize: bool):
+    """Load the sentence transformer once per settings, shared by all evaluator instances"""
+    try:
+        import torch
+        from sentence_transformers import SentenceTransformer
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
+    except ImportError:
+        raise ImportError("sentence-transformers not installed. Install with: pip install sentence-transformers")
+    
+    # Evaluator inputs are short, so don't pad up to the model default
+    model.max_seq_length = max_seq_length
+    
+    # Opt-in fp16 on GPU, dynamic int8 Linear layers on CPU
+    if quantize:
+        if model.device.type == "cuda":
+            model = model.half()
+        else:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
 
 
 class SemanticSimilarityEvaluator(BaseEvaluator):
     """Semantic similarity evaluator using sentence transformers"""
     
+    emb_cache_size = 1024
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self._model = None
+        self._emb_cache: OrderedDict = OrderedDict()
     
     def validate_config(self) -> bool:
         threshold = self.config.get("threshold")
@@ -100,18 +193,40 @@ class SemanticSimilarityEvaluator(BaseEvaluator):
         if not 0 <= threshold <= 1:
             logger.error("SemanticSimilarityEvaluator threshold must be between 0 and 1")
             return False
+        max_seq_length = self.config.get("max_seq_length", 64)
+        if not isinstance(max_seq_length, int) or max_seq_length <= 0:
+            logger.error("SemanticSimilarityEvaluator max_seq_length must be a positive integer")
+            return False
         return True
     
     def _get_model(self):
         """Lazy load sentence transformer model"""
         if self._model is None:
-            try:
-                from sentence_transformers import SentenceTransformer
-                self._model = SentenceTransformer('all-MiniLM-L6-v2')
-            except ImportError:
-                raise ImportError("sentence-transformers not installed. Install with: pip install sentence-transformers")
+            self._model = _load_sentence_model(
+                int(self.config.get("max_seq_length", 64)),
+                # Opt-in: reduced precision can shift scores near the threshold
+                bool(self.config.get("quantize", False))
+            )
         return self._model
     
+    def _encode(self, texts: List[str]) -> List[Any]:
+        """Encode texts to unit-length embeddings, reusing cached vectors"""
+        missing = []
+        for text in dict.fromkeys(texts):
+            if text in self._emb_cache:
+                self._emb_cache.move_to_end(text)
+            else:
+                missing.append(text)
+        if missing:
+            model = self._get_model()
+            embeddings = model.encode(missing, batch_size=128, normalize_embeddings=True)
+            self._emb_cache.update(zip(missing, embeddings))
+        result = [self._emb_cache[text] for text in texts]
+        # Evict least recently used vectors only once this call's lookups are done
+        while len(self._emb_cache) > self.emb_cache_size:
+            self._emb_cache.popitem(last=False)
+        return result
+    
     async def evaluate(self, expected_output: str, actual_output: str,
                       input_data: Optional[Dict[str, Any]] = None,
                       execution_time_ms: Optional[float] = None,
@@ -120,17 +235,10 @@ class SemanticSimilarityEvaluator(BaseEvaluator):
         try:
             threshold = self.config.get("threshold", 0.8)
             
-            # Get model and compute embeddings
-            model = self._get_model()
-            embeddings = model.encode([expected_output, actual_output])
-            
-            # Calculate cosine similarity
+            # Embeddings are normalized, so cosine similarity is a dot product
             import numpy as np
-            similarity = np.dot(embeddings[0], embeddings[1]) / (
-                np.linalg.norm(embeddings[0]) * np.linalg.norm(embeddings[1])
-            )
-            
-            score = float(similarity)
+            expected_emb, actual_emb = self._encode([expected_output, actual_output])
+            score = float(np.dot(expected_emb, actual_emb))
             passed = score >= threshold
             
             return {
@@ -145,18 +253,51 @@ class SemanticSimilarityEvaluator(BaseEvaluator):
                 }
             }
         except Exception as e:
-            logger.error(f"SemanticSimilarityEvaluator error: {e}")
-            return {
-                "evaluator_type": "semantic_similarity",
-                "score": 0.0,
-                "passed": False,
-                "error": str(e)
-            }
+            logger.error("SemanticSimilarityEvaluator error: %s", e)
+            return _error_result("semantic_similarity", str(e))
+    
+    async def evaluate_many(self, test_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Evaluate semantic similarity for all test cases with one encode call"""
+        if not test_cases:
+            return []
+        try:
+            threshold = self.config.get("threshold", 0.8)
+            expected = [test_case.get("expected_output", "") for test_case in test_cases]
+            actual = [test_case.get("actual_output", "") for test_case in test_cases]
+            
+            # Row-wise dot products of the normalized embedding matrices
+            import numpy as np
+            embeddings = self._encode(expected + actual)
+            scores = np.einsum("ij,ij->i", np.asarray(embeddings[:len(expected)]),
+                               np.asarray(embeddings[len(expected):]))
+            
+            results = []
+            for expected_output, actual_output, similarity in zip(expected, actual, scores):
+                score = float(similarity)
+                results.append({
+                    "evaluator_type": "semantic_similarity",
+                    "score": score,
+                    "passed": score >= threshold,
+                    "details": {
+                        "similarity": score,
+                        "threshold": threshold,
+                        "expected": expected_output,
+                        "actual": actual_output
+                    }
+                })
+            return results
+        except Exception as e:
+            logger.error("SemanticSimilarityEvaluator error: %s", e)
+            return [_error_result("semantic_similarity", str(e)) for _ in test_cases]
 
 
 class LatencyEvaluator(BaseEvaluator):
     """Latency evaluator"""
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.max_latency_ms = self.config.get("max_latency_ms", 5000)
+    
     def validate_config(self) -> bool:
         max_latency = self.config.get("max_latency_ms")
         if max_latency is None or not isinstance(max_latency, (int, float)):
@@ -173,23 +314,14 @@ class LatencyEvaluator(BaseEvaluator):
                       cost_usd: Optional[float] = None) -> Dict[str, Any]:
         """Evaluate latency"""
         try:
-            max_latency_ms = self.config.get("max_latency_ms", 5000)
+            max_latency_ms = self.max_latency_ms
             
             if execution_time_ms is None:
-                return {
-                    "evaluator_type": "latency",
-                    "score": 0.0,
-                    "passed": False,
-                    "error": "Execution time not provided"
-                }
-            
-            # Score based on latency (lower is better)
-            if execution_time_ms <= max_latency_ms:
-                score = 1.0 - (execution_time_ms / max_latency_ms) * 0.5  # 0.5 to 1.0
-            else:
-                score = 0.0
+                return _error_result("latency", "Execution time not provided")
             
+            # Score based on latency (lower is better): 0.5 to 1.0 when within budget, else 0.0
             passed = execution_time_ms <= max_latency_ms
+            score = float(passed) * (1.0 - min(execution_time_ms, max_latency_ms) / max_latency_ms * 0.5)
             
             return {
                 "evaluator_type": "latency",
@@ -202,18 +334,17 @@ class LatencyEvaluator(BaseEvaluator):
                 }
             }
         except Exception as e:
-            logger.error(f"LatencyEvaluator error: {e}")
-            return {
-                "evaluator_type": "latency",
-                "score": 0.0,
-                "passed": False,
-                "error": str(e)
-            }
+            logger.error("LatencyEvaluator error: %s", e)
+            return _error_result("latency", str(e))
 
 
 class CostEvaluator(BaseEvaluator):
     """Cost evaluator"""
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.max_cost_usd = self.config.get("max_cost_usd", 0.10)
+    
     def validate_config(self) -> bool:
         max_cost = self.config.get("max_cost_usd")
         if max_cost is None or not isinstance(max_cost, (int, float)):
@@ -230,23 +361,14 @@ class CostEvaluator(BaseEvaluator):
                       cost_usd: Optional[float] = None) -> Dict[str, Any]:
         """Evaluate cost"""
         try:
-            max_cost_usd = self.config.get("max_cost_usd", 0.10)
+            max_cost_usd = self.max_cost_usd
             
             if cost_usd is None:
-                return {
-                    "evaluator_type": "cost",
-                    "score": 0.0,
-                    "passed": False,
-                    "error": "Cost not provided"
-                }
-            
-            # Score based on cost (lower is better)
-            if cost_usd <= max_cost_usd:
-                score = 1.0 - (cost_usd / max_cost_usd) * 0.5  # 0.5 to 1.0
-            else:
-                score = 0.0
+                return _error_result("cost", "Cost not provided")
             
+            # Score based on cost (lower is better): 0.5 to 1.0 when within budget, else 0.0
             passed = cost_usd <= max_cost_usd
+            score = float(passed) * (1.0 - min(cost_usd, max_cost_usd) / max_cost_usd * 0.5)
             
             return {
                 "evaluator_type": "cost",
@@ -259,13 +381,8 @@ class CostEvaluator(BaseEvaluator):
                 }
             }
         except Exception as e:
-            logger.error(f"CostEvaluator error: {e}")
-            return {
-                "evaluator_type": "cost",
-                "score": 0.0,
-                "passed": False,
-                "error": str(e)
-            }
+            logger.error("CostEvaluator error: %s", e)
+            return _error_result("cost", str(e))
 
 
 class LLMJudgeEvaluator(BaseEvaluator):
@@ -275,7 +392,7 @@ class LLMJudgeEvaluator(BaseEvaluator):
         required_fields = ["api_key", "judge_model"]
         for field in required_fields:
             if field not in self.config:
-                logger.error(f"LLMJudgeEvaluator requires '{field}' config")
+                logger.error("LLMJudgeEvaluator requires '%s' config", field)
                 return False
         return True
     
@@ -284,18 +401,30 @@ class LLMJudgeEvaluator(BaseEvaluator):
                       execution_time_ms: Optional[float] = None,
                       cost_usd: Optional[float] = None) -> Dict[str, Any]:
         """Evaluate using LLM judge"""
+        import httpx
+        async with httpx.AsyncClient() as client:
+            return await self._judge(client, expected_output, actual_output, input_data)
+    
+    async def evaluate_many(self, test_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Judge all test cases concurrently over one shared HTTP client"""
+        import httpx
+        async with httpx.AsyncClient() as client:
+            return list(await asyncio.gather(*[
+                self._judge(client, test_case.get("expected_output", ""),
+                            test_case.get("actual_output", ""), test_case.get("input"))
+                for test_case in test_cases
+            ]))
+    
+    async def _judge(self, client, expected_output: str, actual_output: str,
+                     input_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Call the judge model for a single case"""
         try:
             api_key = self.config.get("api_key")
             judge_model = self.config.get("judge_model", "gpt-3.5-turbo")
             threshold = self.config.get("threshold", 0.7)
             
             if not api_key:
-                return {
-                    "evaluator_type": "llm_judge",
-                    "score": 0.0,
-                    "passed": False,
-                    "error": "API key required for LLM judge evaluator"
-                }
+                return _error_result("llm_judge", "API key required for LLM judge evaluator")
             
             # Create judge prompt
             judge_prompt = f"""
@@ -315,66 +444,59 @@ class LLMJudgeEvaluator(BaseEvaluator):
             """
             
             # Call judge model
-            import httpx
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    json={
-                        "model": judge_model,
-                        "messages": [{"role": "user", "content": judge_prompt}],
-                        "temperature": 0.1,
-                        "max_tokens": 10
-                    },
-                    timeout=30.0
-                )
+            response = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={"Authorization": f"Bearer {api_key}"},
+                json={
+                    "model": judge_model,
+                    "messages": [{"role": "user", "content": judge_prompt}],
+                    "temperature": 0.1,
+                    "max_tokens": 10
+                },
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                score_text = result["choices"][0]["message"]["content"].strip()
+                try:
+                    score = float(score_text)
+                    score = max(0.0, min(1.0, score))  # Clamp between 0 and 1
+                except ValueError:
+                    score = 0.0
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    score_text = result["choices"][0]["message"]["content"].strip()
-                    try:
-                        score = float(score_text)
-                        score = max(0.0, min(1.0, score))  # Clamp between 0 and 1
-                    except ValueError:
-                        score = 0.0
-                    
-                    passed = score >= threshold
-                    
-                    return {
-                        "evaluator_type": "llm_judge",
-                        "score": score,
-                        "passed": passed,
-                        "details": {
-                            "judge_model": judge_model,
-                            "threshold": threshold,
-                            "raw_response": score_text,
-                            "score": score
-                        }
-                    }
-                else:
-                    return {
-                        "evaluator_type": "llm_judge",
-                        "score": 0.0,
-                        "passed": False,
-                        "error": f"API call failed: {response.status_code}"
+                passed = score >= threshold
+                
+                return {
+                    "evaluator_type": "llm_judge",
+                    "score": score,
+                    "passed": passed,
+                    "details": {
+                        "judge_model": judge_model,
+                        "threshold": threshold,
+                        "raw_response": score_text,
+                        "score": score
                     }
-                    
+                }
+            else:
+                return _error_result("llm_judge", f"API call failed: {response.status_code}")
+                
         except Exception as e:
-            logger.error(f"LLMJudgeEvaluator error: {e}")
-            return {
-                "evaluator_type": "llm_judge",
-                "score": 0.0,
-                "passed": False,
-                "error": str(e)
-            }
+            logger.error("LLMJudgeEvaluator error: %s", e)
+            return _error_result("llm_judge", str(e))
 
 
 class EvaluatorService:
     """Service for managing and creating evaluators"""
     
+    instance_cache_size = 128
+    
     def __init__(self):
         self._evaluators: Dict[str, Type[BaseEvaluator]] = {}
         self._custom_evaluators: Dict[str, Callable] = {}
+        # Single name -> factory map covering both built-in and custom evaluators
+        self._factories: Dict[str, Callable[[Dict[str, Any]], BaseEvaluator]] = {}
+        self._instance_cache: OrderedDict = OrderedDict()
         self._register_builtin_evaluators()
     
     def _register_builtin_evaluators(self):
@@ -388,12 +510,22 @@ class EvaluatorService:
     def register_evaluator(self, name: str, evaluator_class: Type[BaseEvaluator]):
         """Register an evaluator class"""
         self._evaluators[name] = evaluator_class
-        logger.info(f"Registered evaluator: {name}")
+        self._factories[name] = evaluator_class
+        self._instance_cache.clear()
+        logger.info("Registered evaluator: %s", name)
     
     def register_custom_evaluator(self, name: str, evaluator_func: Callable):
         """Register a custom evaluator function"""
         self._custom_evaluators[name] = evaluator_func
-        logger.info(f"Registered custom evaluator: {name}")
+        if name in self._evaluators:
+            # Built-in evaluator types take precedence over custom ones
+            logger.warning("Custom evaluator '%s' is shadowed by the built-in evaluator", name)
+            return
+        self._factories[name] = functools.partial(CustomEvaluatorWrapper, name, evaluator_func)
+        # Drop cached wrappers around a previously registered function
+        for key in [key for key in self._instance_cache if key[0] == name]:
+            del self._instance_cache[key]
+        logger.info("Registered custom evaluator: %s", name)
     
     def get_available_evaluators(self) -> List[str]:
         """Get list of available evaluator names"""
@@ -401,20 +533,31 @@ class EvaluatorService:
     
     def create_evaluator(self, evaluator_type: str, config: Dict[str, Any]) -> BaseEvaluator:
         """Create an evaluator instance"""
-        if evaluator_type in self._evaluators:
-            evaluator_class = self._evaluators[evaluator_type]
-            evaluator = evaluator_class(config)
-            
-            # Validate configuration
-            if not evaluator.validate_config():
-                raise ValueError(f"Invalid configuration for evaluator: {evaluator_type}")
-            
-            return evaluator
-        elif evaluator_type in self._custom_evaluators:
-            # For custom evaluators, return a wrapper
-            return CustomEvaluatorWrapper(evaluator_type, self._custom_evaluators[evaluator_type], config)
-        else:
+        factory = self._factories.get(evaluator_type)
+        if factory is None:
             raise ValueError(f"Unknown evaluator type: {evaluator_type}")
+        
+        evaluator = factory(config)
+        
+        # Validate configuration
+        if not evaluator.validate_config():
+            raise ValueError(f"Invalid configuration for evaluator: {evaluator_type}")
+        
+        return evaluator
+    
+    def get_evaluator(self, evaluator_type: str, config: Dict[str, Any]) -> BaseEvaluator:
+        """Get a cached evaluator instance, creating and validating it on first use"""
+        key = (evaluator_type, json.dumps(config or {}, sort_keys=True, default=str))
+        evaluator = self._instance_cache.get(key)
+        if evaluator is None:
+            evaluator = self.create_evaluator(evaluator_type, config)
+            self._instance_cache[key] = evaluator
+            # Configs come from job payloads, so keep only the most recently used ones
+            if len(self._instance_cache) > self.instance_cache_size:
+                self._instance_cache.popitem(last=False)
+        else:
+            self._instance_cache.move_to_end(key)
+        return evaluator
     
     async def evaluate_single(self, evaluator_type: str, config: Dict[str, Any],
                             expected_output: str, actual_output: str,
@@ -423,7 +566,7 @@ class EvaluatorService:
                             cost_usd: Optional[float] = None) -> Dict[str, Any]:
         """Evaluate a single case with the specified evaluator"""
         try:
-            evaluator = self.create_evaluator(evaluator_type, config)
+            evaluator = self.get_evaluator(evaluator_type, config)
             result = await evaluator.evaluate(
                 expected_output=expected_output,
                 actual_output=actual_output,
@@ -433,48 +576,48 @@ class EvaluatorService:
             )
             return result
         except Exception as e:
-            logger.error(f"Evaluation failed for {evaluator_type}: {e}")
-            return {
-                "evaluator_type": evaluator_type,
-                "score": 0.0,
-                "passed": False,
-                "error": str(e)
-            }
+            logger.error("Evaluation failed for %s: %s", evaluator_type, e)
+            return _error_result(evaluator_type, str(e))
     
     async def evaluate_batch(self, evaluator_configs: List[Dict[str, Any]],
                            test_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Evaluate multiple test cases with multiple evaluators"""
-        results = []
-        
-        for test_case in test_cases:
-            test_result = {
-                "test_case": test_case,
-                "evaluator_results": []
-            }
+        # Build each evaluator once up front rather than once per test case
+        evaluators = []
+        for evaluator_config in evaluator_configs:
+            evaluator_type = evaluator_config.get("evaluator_type")
+            config = evaluator_config.get("config", {})
             
-            for evaluator_config in evaluator_configs:
-                evaluator_type = evaluator_config.get("evaluator_type")
-                config = evaluator_config.get("config", {})
-                
-                if not evaluator_type:
-                    logger.error("Missing evaluator_type in config")
-                    continue
-                
-                result = await self.evaluate_single(
-                    evaluator_type=evaluator_type,
-                    config=config,
-                    expected_output=test_case.get("expected_output", ""),
-                    actual_output=test_case.get("actual_output", ""),
-                    input_data=test_case.get("input"),
-                    execution_time_ms=test_case.get("latency_ms"),
-                    cost_usd=test_case.get("cost_usd")
-                )
-                
-                test_result["evaluator_results"].append(result)
+            if not evaluator_type:
+                logger.error("Missing evaluator_type in config")
+                continue
             
-            results.append(test_result)
+            try:
+                evaluators.append((evaluator_type, self.get_evaluator(evaluator_type, config)))
+            except Exception as e:
+                logger.error("Evaluation failed for %s: %s", evaluator_type, e)
+                evaluators.append((evaluator_type, e))
         
-        return results
+        # Run each evaluator over all test cases at once so batched paths
+        # (one encode call, one shared HTTP client) can kick in, and run the
+        # evaluators themselves concurrently
+        async def run(evaluator_type, evaluator):
+            if isinstance(evaluator, Exception):
+                return [_error_result(evaluator_type, str(evaluator)) for _ in test_cases]
+            return await evaluator.evaluate_many(test_cases)
+        
+        per_evaluator_results = await asyncio.gather(*(
+            run(evaluator_type, evaluator) for evaluator_type, evaluator in evaluators
+        ))
+        
+        # Transpose back to one entry per test case
+        return [
+            {
+                "test_case": test_case,
+                "evaluator_results": [evaluator_results[i] for evaluator_results in per_evaluator_results]
+            }
+            for i, test_case in enumerate(test_cases)
+        ]
 
 
 class CustomEvaluatorWrapper(BaseEvaluator):
@@ -519,13 +662,8 @@ class CustomEvaluatorWrapper(BaseEvaluator):
             
             return result
         except Exception as e:
-            logger.error(f"Custom evaluator {self.name} error: {e}")
-            return {
-                "evaluator_type": self.name,
-                "score": 0.0,
-                "passed": False,
-                "error": str(e)
-            }
+            logger.error("Custom evaluator %s error: %s", self.name, e)
+            return _error_result(self.name, str(e))
 
 
 # Global evaluator service instance
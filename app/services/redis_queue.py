@@ -1,32 +1,69 @@
 import json
+import time
 import uuid
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import msgpack
 import redis.asyncio as redis
 from app.config import settings
 
 
 class RedisQueue:
-    def __init__(self):
-        self.redis_client = redis.from_url(settings.redis_url)
-        self.evaluation_queue = "evaluation_jobs"
+    # Jobs per pipelined round trip; at three commands each this stays near
+    # the ~10k commands per batch Redis suggests for pipelining
+    bulk_chunk_size = 3000
+    
+    def __init__(self, redis_client: Optional[redis.Redis] = None, queue_name: str = "evaluation_jobs"):
+        # Callers that already hold a client can share its connection pool
+        self.redis_client = redis_client or redis.from_url(settings.redis_url)
+        self.evaluation_queue = queue_name
         self.progress_prefix = "progress:"
         self.job_prefix = "job:"
+        self.job_status_prefix = "job_status:"
     
-    async def enqueue_job(self, job_data: Dict[str, Any]) -> str:
-        """Enqueue an evaluation job and return job ID"""
-        job_id = str(uuid.uuid4())
+    def _queue_job(self, pipe, job_data: Dict[str, Any], push: bool = True) -> str:
+        """Add the commands that enqueue one job to a pipeline and return its ID"""
+        job_id = uuid.uuid4().hex
         job_data["job_id"] = job_id
         job_data["status"] = "queued"
-        job_data["created_at"] = str(uuid.uuid1().time)
+        job_data["created_at"] = str(time.time_ns())
         
-        # Store job details
-        await self.redis_client.hset(
-            f"{self.job_prefix}{job_id}",
-            mapping=job_data
-        )
+        # Store the immutable job body as a single msgpack blob and keep the
+        # mutable status/progress fields in a small hash alongside it
+        body = {k: v for k, v in job_data.items() if k not in ("status", "progress")}
+        pipe.set(f"{self.job_prefix}{job_id}", msgpack.packb(body))
+        pipe.hset(f"{self.job_status_prefix}{job_id}", "status", job_data["status"])
+        # Add to queue, unless the caller is reserving the job for itself
+        if push:
+            pipe.lpush(self.evaluation_queue, job_id)
+        return job_id
+    
+    async def enqueue_job(self, job_data: Dict[str, Any]) -> str:
+        """Enqueue an evaluation job and return job ID"""
+        async with self.redis_client.pipeline() as pipe:
+            job_id = self._queue_job(pipe, job_data)
+            await pipe.execute()
+        
+        return job_id
+    
+    async def enqueue_jobs_bulk(self, jobs: List[Dict[str, Any]]) -> List[str]:
+        """Enqueue several evaluation jobs in one round trip per chunk and return their IDs"""
+        job_ids = []
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for start in range(0, len(jobs), self.bulk_chunk_size):
+                job_ids.extend(self._queue_job(pipe, job_data) for job_data in jobs[start:start + self.bulk_chunk_size])
+                await pipe.execute()
         
-        # Add to queue
-        await self.redis_client.lpush(self.evaluation_queue, job_id)
+        return job_ids
+    
+    async def reserve_job(self, job_data: Dict[str, Any]) -> str:
+        """Store a job for the caller to process directly and return its ID.
+        
+        Equivalent to enqueueing and immediately dequeueing it, in one round
+        trip and without the job ever being visible to other workers.
+        """
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            job_id = self._queue_job(pipe, job_data, push=False)
+            await pipe.execute()
         
         return job_id
     
@@ -36,26 +73,58 @@ class RedisQueue:
         if not job_id:
             return None
         
-        job_data = await self.redis_client.hgetall(f"{self.job_prefix}{job_id.decode()}")
-        if job_data:
-            # Convert bytes to strings
-            return {k.decode(): v.decode() if isinstance(v, bytes) else v 
-                   for k, v in job_data.items()}
-        return None
+        return await self.get_job_status(job_id.decode())
+    
+    async def dequeue_jobs(self, count: int) -> List[Dict[str, Any]]:
+        """Dequeue up to count jobs: one RPOP with COUNT, then one pipelined fetch"""
+        job_ids = await self.redis_client.rpop(self.evaluation_queue, count)
+        if not job_ids:
+            return []
+        
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                job_id = job_id.decode()
+                pipe.get(f"{self.job_prefix}{job_id}")
+                pipe.hgetall(f"{self.job_status_prefix}{job_id}")
+            replies = await pipe.execute()
+        
+        jobs = (self._decode_job(raw, status_data) for raw, status_data in zip(replies[::2], replies[1::2]))
+        return [job for job in jobs if job]
     
     async def update_job_status(self, job_id: str, status: str, progress: Optional[int] = None):
         """Update job status and progress"""
-        await self.redis_client.hset(f"{self.job_prefix}{job_id}", "status", status)
+        mapping = {"status": status}
         if progress is not None:
-            await self.redis_client.hset(f"{self.job_prefix}{job_id}", "progress", progress)
+            mapping["progress"] = progress
+        await self.redis_client.hset(f"{self.job_status_prefix}{job_id}", mapping=mapping)
     
     async def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get job status and progress"""
-        job_data = await self.redis_client.hgetall(f"{self.job_prefix}{job_id}")
-        if job_data:
-            return {k.decode(): v.decode() if isinstance(v, bytes) else v 
-                   for k, v in job_data.items()}
-        return None
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(f"{self.job_prefix}{job_id}")
+            pipe.hgetall(f"{self.job_status_prefix}{job_id}")
+            raw, status_data = await pipe.execute()
+        
+        return self._decode_job(raw, status_data)
+    
+    def _decode_job(self, raw: Optional[bytes], status_data: Dict[bytes, bytes]) -> Optional[Dict[str, Any]]:
+        """Rebuild a job dict from its msgpack body and status hash"""
+        if not raw:
+            return None
+        
+        job_data = msgpack.unpackb(raw, raw=False)
+        job_data.update({k.decode(): v.decode() for k, v in status_data.items()})
+        return job_data
+    
+    async def delete_jobs(self, job_ids: List[str]):
+        """Remove the stored body and status of the given jobs, plus any IDs still queued"""
+        if not job_ids:
+            return
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.lrem(self.evaluation_queue, 0, job_id)
+            pipe.delete(*(f"{prefix}{job_id}" for job_id in job_ids for prefix in (self.job_prefix, self.job_status_prefix)))
+            await pipe.execute()
     
     async def store_progress(self, run_id: str, completed: int, total: int):
         """Store experiment run progress"""
@@ -0,0 +1,355 @@
+"""
+Static seed data for reset_and_seed.py
+Foreign key fields hold the index of the parent row in its seed tuple;
+the seeder swaps in the real id once the parent rows are inserted
+"""
+
+from app.models.experiment import ExperimentStatus, RunStatus
+
+
+# Default login for seeded users; a user row may override it with "password"
+SEED_PASSWORD = "password123"
+
+ORGANIZATIONS = (
+    {
+        "name": "Acme Corporation",
+        "slug": "acme-corp",
+        "description": "A leading technology company focused on AI and machine learning solutions."
+    },
+    {
+        "name": "TechStart Inc",
+        "slug": "techstart",
+        "description": "A startup building innovative AI-powered applications."
+    },
+    {
+        "name": "Research Labs",
+        "slug": "research-labs",
+        "description": "Academic research organization specializing in NLP and LLM research."
+    }
+)
+
+USERS = (
+    {
+        "email": "admin@acme.com",
+        "username": "admin_acme",
+        "full_name": "Admin User",
+        "is_active": True,
+        "is_superuser": True,
+        "organization_id": 0
+    },
+    {
+        "email": "developer@acme.com",
+        "username": "dev_acme",
+        "full_name": "Developer User",
+        "is_active": True,
+        "is_superuser": False,
+        "organization_id": 0
+    },
+    {
+        "email": "founder@techstart.com",
+        "username": "founder_tech",
+        "full_name": "TechStart Founder",
+        "is_active": True,
+        "is_superuser": True,
+        "organization_id": 1
+    },
+    {
+        "email": "researcher@research.com",
+        "username": "researcher",
+        "full_name": "Research Scientist",
+        "is_active": True,
+        "is_superuser": False,
+        "organization_id": 2
+    }
+)
+
+PROJECTS = (
+    {
+        "name": "Customer Support AI",
+        "description": "AI-powered customer support system using LLMs to answer customer queries.",
+        "is_active": True,
+        "organization_id": 0,
+        "owner_id": 0
+    },
+    {
+        "name": "Content Generation Platform",
+        "description": "Platform for generating marketing content using various LLM models.",
+        "is_active": True,
+        "organization_id": 0,
+        "owner_id": 1
+    },
+    {
+        "name": "Code Assistant",
+        "description": "AI-powered code completion and review system for developers.",
+        "is_active": True,
+        "organization_id": 1,
+        "owner_id": 2
+    },
+    {
+        "name": "NLP Research",
+        "description": "Research project on natural language processing and model evaluation.",
+        "is_active": True,
+        "organization_id": 2,
+        "owner_id": 3
+    }
+)
+
+PROMPTS = (
+    {
+        "name": "Customer Support Assistant",
+        "description": "AI assistant for handling customer support queries",
+        "is_active": True,
+        "is_deployed": True,
+        "project_id": 0
+    },
+    {
+        "name": "Content Writer",
+        "description": "AI writer for generating marketing content",
+        "is_active": True,
+        "is_deployed": True,
+        "project_id": 1
+    },
+    {
+        "name": "Code Reviewer",
+        "description": "AI code reviewer for analyzing and improving code",
+        "is_active": True,
+        "is_deployed": False,
+        "project_id": 2
+    },
+    {
+        "name": "Text Summarizer",
+        "description": "AI text summarizer for research papers",
+        "is_active": True,
+        "is_deployed": True,
+        "project_id": 3
+    }
+)
+
+PROMPT_VERSIONS = (
+    {
+        "version": "1.0.0",
+        "template": "You are a helpful customer support assistant. Please help the customer with their query: {{customer_query}}",
+        "variables": {
+            "customer_query": "string"
+        },
+        "is_deployed": True,
+        "prompt_id": 0
+    },
+    {
+        "version": "1.1.0",
+        "template": "You are a helpful customer support assistant. Please help the customer with their query: {{customer_query}}. Be polite and professional.",
+        "variables": {
+            "customer_query": "string"
+        },
+        "is_deployed": True,
+        "prompt_id": 0
+    },
+    {
+        "version": "1.0.0",
+        "template": "You are a professional content writer. Write engaging content about: {{topic}}",
+        "variables": {
+            "topic": "string"
+        },
+        "is_deployed": True,
+        "prompt_id": 1
+    },
+    {
+        "version": "1.0.0",
+        "template": "You are a code reviewer. Review this code and provide feedback: {{code}}",
+        "variables": {
+            "code": "string"
+        },
+        "is_deployed": False,
+        "prompt_id": 2
+    },
+    {
+        "version": "1.0.0",
+        "template": "Summarize the following text in a concise manner: {{text}}",
+        "variables": {
+            "text": "string"
+        },
+        "is_deployed": True,
+        "prompt_id": 3
+    }
+)
+
+DATASETS = (
+    {
+        "name": "Customer Support Queries",
+        "description": "Collection of customer support queries and expected responses",
+        "is_active": True,
+        "project_id": 0
+    },
+    {
+        "name": "Marketing Content",
+        "description": "Marketing content examples for different industries",
+        "is_active": True,
+        "project_id": 1
+    },
+    {
+        "name": "Code Review Examples",
+        "description": "Code examples for testing code review capabilities",
+        "is_active": True,
+        "project_id": 2
+    },
+    {
+        "name": "Research Papers",
+        "description": "Research paper abstracts for summarization testing",
+        "is_active": True,
+        "project_id": 3
+    }
+)
+
+CUSTOMER_QUERIES = (
+    {"customer_query": "How do I reset my password?"},
+    {"customer_query": "I can't log into my account"},
+    {"customer_query": "Where can I find my order history?"},
+    {"customer_query": "How do I cancel my subscription?"},
+    {"customer_query": "What are your business hours?"}
+)
+
+EXPECTED_RESPONSES = (
+    "To reset your password, go to the login page and click 'Forgot Password'. You'll receive an email with reset instructions.",
+    "Please try clearing your browser cache and cookies. If the issue persists, contact our support team.",
+    "You can find your order history in your account dashboard under the 'Orders' section.",
+    "To cancel your subscription, go to Account Settings > Subscription and click 'Cancel Subscription'.",
+    "Our business hours are Monday to Friday, 9 AM to 6 PM EST."
+)
+
+MARKETING_TOPICS = (
+    {"topic": "AI in healthcare"},
+    {"topic": "Sustainable energy solutions"},
+    {"topic": "Remote work productivity"},
+    {"topic": "Cybersecurity best practices"},
+    {"topic": "Digital transformation"}
+)
+
+CODE_EXAMPLES = (
+    {"code": "def add(a, b):\n    return a + b"},
+    {"code": "for i in range(10):\n    print(i)"},
+    {"code": "class User:\n    def __init__(self, name):\n        self.name = name"},
+    {"code": "import pandas as pd\ndf = pd.read_csv('data.csv')"},
+    {"code": "async def fetch_data():\n    async with aiohttp.ClientSession() as session:\n        async with session.get(url) as response:\n            return await response.json()"}
+)
+
+RESEARCH_TEXTS = (
+    {"text": "This paper presents a novel approach to natural language processing using transformer architectures. The proposed method achieves state-of-the-art results on multiple benchmark datasets."},
+    {"text": "We investigate the effectiveness of different machine learning algorithms for sentiment analysis. Our experiments show that deep learning models outperform traditional methods."},
+    {"text": "This study examines the impact of data augmentation techniques on model performance. Results indicate significant improvements in accuracy and generalization."},
+    {"text": "We propose a new framework for evaluating large language models. The framework provides comprehensive metrics for assessing model capabilities."},
+    {"text": "This research explores the relationship between model size and performance in natural language understanding tasks. Findings suggest diminishing returns beyond certain thresholds."}
+)
+
+# (dataset index, ((input_data, expected_output), ...)) per dataset
+DATASET_ITEMS = (
+    (0, tuple(zip(CUSTOMER_QUERIES, EXPECTED_RESPONSES))),
+    (1, tuple((topic, "[Generated marketing content would go here]") for topic in MARKETING_TOPICS)),
+    (2, tuple((code, "[Code review feedback would go here]") for code in CODE_EXAMPLES)),
+    (3, tuple((paper, "[Generated summary would go here]") for paper in RESEARCH_TEXTS))
+)
+
+# (metric name, low, high) for the random sample metrics
+METRIC_SPECS = (("accuracy", 0.7, 0.95), ("latency_ms", 500, 2000))
+
+EXPERIMENTS = (
+    {
+        "name": "Customer Support AI Evaluation",
+        "description": "Evaluating the performance of customer support AI responses",
+        "status": ExperimentStatus.ACTIVE,
+        "prompt_id": 0,
+        "dataset_id": 0,
+        "model_configuration": {
+            "provider": "openai",
+            "model": "gpt-3.5-turbo",
+            "temperature": 0.7,
+            "max_tokens": 150
+        },
+        "evaluation_config": {
+            "metrics": ["accuracy", "relevance", "helpfulness"],
+            "thresholds": {
+                "accuracy": 0.8,
+                "relevance": 0.7
+            }
+        },
+        "project_id": 0
+    },
+    {
+        "name": "Content Generation Quality Test",
+        "description": "Testing content generation quality across different topics",
+        "status": ExperimentStatus.ACTIVE,
+        "prompt_id": 1,
+        "dataset_id": 1,
+        "model_configuration": {
+            "provider": "anthropic",
+            "model": "claude-3-sonnet",
+            "temperature": 0.8,
+            "max_tokens": 200
+        },
+        "evaluation_config": {
+            "metrics": ["creativity", "engagement", "clarity"],
+            "thresholds": {
+                "creativity": 0.7,
+                "engagement": 0.6
+            }
+        },
+        "project_id": 1
+    }
+)
+
+EXPERIMENT_RUNS = (
+    {
+        "status": RunStatus.COMPLETED,
+        "total_items": 5,
+        "completed_items": 5,
+        "failed_items": 0,
+        "metrics": {
+            "accuracy": 0.85,
+            "relevance": 0.78,
+            "helpfulness": 0.82
+        },
+        "experiment_id": 0
+    },
+    {
+        "status": RunStatus.PENDING,
+        "total_items": 5,
+        "completed_items": 0,
+        "failed_items": 0,
+        "metrics": None,
+        "experiment_id": 1
+    }
+)
+
+TRACES = (
+    {
+        "prompt_id": 0,
+        "input_data": {
+            "customer_query": "How do I reset my password?"
+        },
+        "output_data": {
+            "response": "To reset your password, go to the login page and click 'Forgot Password'."
+        },
+        "latency_ms": 1250.5,
+        "tokens_used": 45,
+        "cost_usd": 0.0025,
+        "model_name": "gpt-3.5-turbo",
+        "model_provider": "openai",
+        "is_success": True,
+        "project_id": 0
+    },
+    {
+        "prompt_id": 1,
+        "input_data": {
+            "topic": "AI in healthcare"
+        },
+        "output_data": {
+            "content": "AI is revolutionizing healthcare by enabling..."
+        },
+        "latency_ms": 2100.0,
+        "tokens_used": 120,
+        "cost_usd": 0.0080,
+        "model_name": "claude-3-sonnet",
+        "model_provider": "anthropic",
+        "is_success": True,
+        "project_id": 1
+    }
+)
@@ -4,155 +4,158 @@ Simple backend server test
 Quick test to verify your FastAPI backend server
 """
 
-import requests
+import asyncio
+import httpx
+import orjson
 import sys
+from typing import Any, Optional, Tuple
 from app.config import settings
 
+# Use the libuv event loop when available (installed with uvicorn[standard])
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Per-check deadline so one stuck endpoint can't stall the whole run
+CHECK_TIMEOUT = 2.0
+# Submitting an evaluation writes to the DB and enqueues a job, so it gets a longer budget
+SUBMIT_TIMEOUT = 30.0
+
+
+# Evaluation request body, serialized once and sent as raw bytes
+_EVAL_BODY = orjson.dumps({
+    "experiment_run_id": "test-run-123",
+    "evaluator_configs": [
+        {
+            "evaluator_type": "exact_match",
+            "config": {"case_sensitive": False}
+        }
+    ],
+    "test_cases": [
+        {
+            "input": "Hello",
+            "expected_output": "Hello",
+            "actual_output": "Hello"
+        }
+    ]
+})
 
-def test_server_health():
-    """Test server health endpoint"""
-    print("🔍 Testing server health...")
-    
+
+def _json(response):
+    """Decode a JSON response body with orjson"""
+    return orjson.loads(response.content)
+
+
+async def _probe(client: httpx.AsyncClient, method: str, path: str, label: str, *,
+                 body: Optional[bytes] = None, timeout: float = 10, expect: int = 200) -> Tuple[bool, Any]:
+    """Send one request and return (ok, decoded JSON body or None), printing any failure"""
     try:
-        response = requests.get("http://localhost:8000/health", timeout=10)
+        response = await client.request(
+            method, path,
+            content=body,
+            headers={"Content-Type": "application/json"} if body is not None else None,
+            timeout=timeout
+        )
+        
+        if response.status_code == expect:
+            return True, _json(response) if response.content else None
+        
+        print(f"❌ {label} failed: {response.status_code}")
+        if body is not None:
+            print(f"Response: {response.text}")
+        return False, None
         
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Server is healthy: {data}")
-            return True
-        else:
-            print(f"❌ Server health check failed: {response.status_code}")
-            return False
-            
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("❌ Cannot connect to server. Is it running?")
-        return False
+        return False, None
     except Exception as e:
-        print(f"❌ Health check error: {e}")
-        return False
+        print(f"❌ {label} error: {e}")
+        return False, None
 
 
-def test_server_info():
+async def test_server_health(client: httpx.AsyncClient):
+    """Test server health endpoint"""
+    print("🔍 Testing server health...")
+    ok, data = await _probe(client, "GET", "/health", "Server health check")
+    if ok:
+        print(f"✅ Server is healthy: {data}")
+    return ok
+
+
+async def test_server_info(client: httpx.AsyncClient):
     """Test server info endpoint"""
     print("\n🔍 Testing server info...")
-    
-    try:
-        response = requests.get("http://localhost:8000/", timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Server info: {data.get('title', 'Unknown')}")
-            return True
-        else:
-            print(f"❌ Server info failed: {response.status_code}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Server info error: {e}")
-        return False
+    ok, data = await _probe(client, "GET", "/", "Server info")
+    if ok:
+        print(f"✅ Server info: {data.get('title', 'Unknown')}")
+    return ok
 
 
-def test_database_health():
+async def test_database_health(client: httpx.AsyncClient):
     """Test database health endpoint"""
     print("\n🔍 Testing database health...")
-    
-    try:
-        response = requests.get("http://localhost:8000/health/db", timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Database is healthy: {data.get('status', 'Unknown')}")
-            return True
-        else:
-            print(f"❌ Database health check failed: {response.status_code}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Database health error: {e}")
-        return False
+    ok, data = await _probe(client, "GET", "/health/db", "Database health check")
+    if ok:
+        print(f"✅ Database is healthy: {data.get('status', 'Unknown')}")
+    return ok
 
 
-def test_redis_health():
+async def test_redis_health(client: httpx.AsyncClient):
     """Test Redis health endpoint"""
     print("\n🔍 Testing Redis health...")
-    
-    try:
-        response = requests.get("http://localhost:8000/health/redis", timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Redis is healthy: {data.get('status', 'Unknown')}")
-            return True
-        else:
-            print(f"❌ Redis health check failed: {response.status_code}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Redis health error: {e}")
-        return False
+    ok, data = await _probe(client, "GET", "/health/redis", "Redis health check")
+    if ok:
+        print(f"✅ Redis is healthy: {data.get('status', 'Unknown')}")
+    return ok
 
 
-def test_api_docs():
+async def test_api_docs(client: httpx.AsyncClient):
     """Test API documentation"""
     print("\n🔍 Testing API documentation...")
-    
-    try:
-        response = requests.get("http://localhost:8000/docs", timeout=10)
-        
-        if response.status_code == 200:
-            print("✅ API documentation is available")
-            return True
-        else:
-            print(f"❌ API documentation failed: {response.status_code}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ API docs error: {e}")
-        return False
+    # Only the status matters, so skip downloading the page
+    ok, _ = await _probe(client, "HEAD", "/docs", "API documentation")
+    if ok:
+        print("✅ API documentation is available")
+    return ok
 
 
-def test_basic_evaluation():
+async def test_basic_evaluation(client: httpx.AsyncClient):
     """Test basic evaluation endpoint"""
     print("\n🔍 Testing evaluation endpoint...")
-    
-    test_data = {
-        "experiment_run_id": "test-run-123",
-        "evaluator_configs": [
-            {
-                "evaluator_type": "exact_match",
-                "config": {"case_sensitive": False}
-            }
-        ],
-        "test_cases": [
-            {
-                "input": "Hello",
-                "expected_output": "Hello",
-                "actual_output": "Hello"
-            }
-        ]
-    }
-    
+    ok, data = await _probe(client, "POST", "/evaluations/submit", "Evaluation submission", body=_EVAL_BODY, timeout=SUBMIT_TIMEOUT)
+    if ok:
+        print(f"✅ Evaluation submitted successfully: {data.get('job_id')}")
+    return ok
+
+
+async def run_check(test_name, test_func, client: httpx.AsyncClient, deadline: float = CHECK_TIMEOUT):
+    """Run one check under its own deadline"""
     try:
-        response = requests.post(
-            "http://localhost:8000/evaluations/submit",
-            json=test_data,
-            headers={"Content-Type": "application/json"},
-            timeout=30
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            job_id = data.get("job_id")
-            print(f"✅ Evaluation submitted successfully: {job_id}")
-            return True
-        else:
-            print(f"❌ Evaluation submission failed: {response.status_code}")
-            print(f"Response: {response.text}")
-            return False
-            
+        async with asyncio.timeout(deadline):
+            return test_name, await test_func(client)
+    except TimeoutError:
+        print(f"❌ {test_name} timed out after {deadline}s")
+        return test_name, False
     except Exception as e:
-        print(f"❌ Evaluation error: {e}")
-        return False
+        print(f"❌ {test_name} failed with exception: {e}")
+        return test_name, False
+
+
+async def run_tests(tests):
+    """Run the independent checks concurrently over one pooled client"""
+    limits = httpx.Limits(max_connections=8, keepalive_expiry=60)
+    outcomes = {}
+    
+    async with httpx.AsyncClient(base_url="http://localhost:8000", limits=limits) as client:
+        # Collect results as they arrive; the summary keeps the declared order
+        checks = [run_check(test_name, test_func, client, deadline) for test_name, test_func, deadline in tests]
+        for next_done in asyncio.as_completed(checks):
+            test_name, success = await next_done
+            outcomes[test_name] = success
+    
+    return [(test_name, outcomes[test_name]) for test_name, _, _ in tests]
 
 
 def main():
@@ -162,24 +165,17 @@ def main():
     print("Testing server at: http://localhost:8000")
     print("=" * 50)
     
+    # (name, check, deadline in seconds)
     tests = [
-        ("Server Health", test_server_health),
-        ("Server Info", test_server_info),
-        ("Database Health", test_database_health),
-        ("Redis Health", test_redis_health),
-        ("API Documentation", test_api_docs),
-        ("Evaluation Endpoint", test_basic_evaluation),
+        ("Server Health", test_server_health, CHECK_TIMEOUT),
+        ("Server Info", test_server_info, CHECK_TIMEOUT),
+        ("Database Health", test_database_health, CHECK_TIMEOUT),
+        ("Redis Health", test_redis_health, CHECK_TIMEOUT),
+        ("API Documentation", test_api_docs, CHECK_TIMEOUT),
+        ("Evaluation Endpoint", test_basic_evaluation, SUBMIT_TIMEOUT),
     ]
     
-    results = []
-    
-    for test_name, test_func in tests:
-        try:
-            success = test_func()
-            results.append((test_name, success))
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
-            results.append((test_name, False))
+    results = asyncio.run(run_tests(tests))
     
     # Summary
     print("\n" + "=" * 50)
@@ -4,9 +4,18 @@ Simple PostgreSQL connection test with SQLAlchemy
 Quick test to verify your database connection
 """
 
+import atexit
 from sqlalchemy import create_engine, text
 from app.config import settings
 
+# Read settings once and build the engine once; create_engine doesn't connect
+_DB_URL = settings.database_url
+_ENGINE = create_engine(_DB_URL, pool_pre_ping=settings.db_pool_pre_ping, pool_recycle=settings.db_pool_recycle, pool_size=1)
+atexit.register(_ENGINE.dispose)
+
+# Built once at import instead of per call
+SQL_QUICK = text("SELECT 1 AS test, current_database() AS db, current_user AS usr")
+
 
 def quick_test():
     """Quick database connection test"""
@@ -14,27 +23,20 @@ def quick_test():
     print("-" * 40)
     
     # Display connection info
-    print(f"Database URL: {settings.database_url}")
+    print(f"Database URL: {_DB_URL}")
     print(f"Host: localhost:5433")
     print(f"Database: llm_platform")
     print(f"User: llm_user")
     print()
     
     try:
-        # Create engine
-        engine = create_engine(settings.database_url)
-        
         # Test connection
-        with engine.connect() as connection:
-            # Simple test query
-            result = connection.execute(text("SELECT 1 as test"))
-            value = result.fetchone()[0]
+        with _ENGINE.connect() as connection:
+            # Test query and database info in one round-trip
+            result = connection.execute(SQL_QUICK)
+            value, db_name, user = result.fetchone()
             print(f"✅ Connection successful! Test result: {value}")
-            
-            # Get database info
-            result = connection.execute(text("SELECT current_database(), current_user"))
-            db_info = result.fetchone()
-            print(f"🗄️  Connected to: {db_info[0]} as {db_info[1]}")
+            print(f"🗄️  Connected to: {db_name} as {user}")
             
             return True
             
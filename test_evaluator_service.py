@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the evaluator service
+Run with: pytest test_evaluator_service.py
+"""
+
+from app.services.evaluator_service import (
+    EvaluatorService,
+    ExactMatchEvaluator,
+    SemanticSimilarityEvaluator,
+)
+
+
+class _FakeModel:
+    """Stands in for the sentence transformer; records what it was asked to encode"""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=None, normalize_embeddings=False):
+        self.calls.append(list(texts))
+        return [f"emb:{text}" for text in texts]
+
+
+def test_embedding_cache_overflow_keeps_current_texts():
+    """Overflowing the cache with a mix of hits and misses still returns every embedding"""
+    evaluator = SemanticSimilarityEvaluator({"threshold": 0.8})
+    evaluator.emb_cache_size = 3
+    evaluator._model = model = _FakeModel()
+
+    assert evaluator._encode(["a", "b", "c"]) == ["emb:a", "emb:b", "emb:c"]
+
+    # Two hits plus two misses go over the limit of three
+    assert evaluator._encode(["a", "b", "d", "e"]) == ["emb:a", "emb:b", "emb:d", "emb:e"]
+    assert model.calls[-1] == ["d", "e"]
+
+    # Least recently used entries are evicted first
+    assert list(evaluator._emb_cache) == ["b", "d", "e"]
+
+    # A re-hit survives the next overflow while older entries go
+    assert evaluator._encode(["b", "f"]) == ["emb:b", "emb:f"]
+    assert model.calls[-1] == ["f"]
+    assert list(evaluator._emb_cache) == ["e", "b", "f"]
+
+
+def test_reregistering_custom_evaluator_replaces_it():
+    """Registering a custom evaluator again swaps in the new function and drops cached wrappers"""
+    service = EvaluatorService()
+    service.register_custom_evaluator("custom", lambda *args: {"score": 0.0})
+    old = service.get_evaluator("custom", {})
+
+    def new_func(*args):
+        return {"score": 1.0}
+
+    service.register_custom_evaluator("custom", new_func)
+    evaluator = service.get_evaluator("custom", {})
+    assert evaluator is not old
+    assert evaluator.evaluator_func is new_func
+
+
+def test_custom_evaluator_does_not_replace_builtin():
+    """A custom evaluator registered under a built-in name leaves the built-in in place"""
+    service = EvaluatorService()
+    service.register_custom_evaluator("exact_match", lambda *args: {"score": 0.0})
+    assert isinstance(service.get_evaluator("exact_match", {}), ExactMatchEvaluator)
+
+
+def test_instance_cache_is_bounded():
+    """Distinct configs beyond the cache size evict the least recently used instance"""
+    service = EvaluatorService()
+    service.instance_cache_size = 2
+    first = service.get_evaluator("exact_match", {"case_sensitive": True})
+    service.get_evaluator("exact_match", {"case_sensitive": False})
+    # Touch the first config so the second becomes the eviction candidate
+    assert service.get_evaluator("exact_match", {"case_sensitive": True}) is first
+    service.get_evaluator("exact_match", {"strip_whitespace": False})
+
+    assert len(service._instance_cache) == 2
+    assert service.get_evaluator("exact_match", {"case_sensitive": True}) is first
@@ -5,150 +5,138 @@ Run this to test your Redis connection
 """
 
 import asyncio
+import atexit
 import sys
+from typing import Any, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
 import redis
 import redis.asyncio as redis_async
 from app.config import settings
 
+# One pool shared by every sync test, so connections are reused instead of re-dialled;
+# replies are decoded to str by the parser rather than per value in the tests
+_POOL = redis.ConnectionPool.from_url(settings.redis_url, max_connections=10, decode_responses=True)
+_R = redis.Redis(connection_pool=_POOL)
+atexit.register(_POOL.disconnect)
 
-def test_sync_connection():
+
+def _log(report: Optional[List[str]], name: str, ok: bool, detail: Any = None):
+    """Add one line to a test's report (dropped when the test runs without one, e.g. under pytest)"""
+    if report is not None:
+        report.append(f"{'✅' if ok else '❌'} {name}{'' if detail is None else f': {detail}'}\n")
+
+
+def test_sync_connection(r=_R, report: Optional[List[str]] = None):
     """Test synchronous Redis connection"""
-    print("🔍 Testing synchronous Redis connection...")
-    
     try:
-        # Create Redis client
-        r = redis.from_url(settings.redis_url)
-        
-        # Test basic connection
-        result = r.ping()
-        print(f"✅ Sync connection successful! Ping result: {result}")
+        # Ping, set/get and clean up in a single round trip
+        pipe = r.pipeline()
+        pipe.ping()
+        pipe.set("test_key", "test_value")
+        pipe.get("test_key")
+        pipe.delete("test_key")
+        result, _, value, _ = pipe.execute()
         
-        # Test basic operations
-        r.set("test_key", "test_value")
-        value = r.get("test_key")
-        print(f"✅ Set/Get test successful: {value.decode()}")
-        
-        # Clean up
-        r.delete("test_key")
+        _log(report, "Sync connection successful, ping result", True, result)
+        _log(report, "Set/Get test successful", True, value)
         
         return True
         
     except Exception as e:
-        print(f"❌ Sync connection failed: {e}")
+        _log(report, "Sync connection failed", False, e)
         return False
 
 
-async def test_async_connection():
+# The async checks are named check_* so pytest doesn't try to collect them: they
+# need the shared async client that _async_main passes in
+async def check_async_connection(r, report: List[str]):
     """Test asynchronous Redis connection"""
-    print("\n🔍 Testing asynchronous Redis connection...")
-    
     try:
-        # Create async Redis client
-        r = redis_async.from_url(settings.redis_url)
-        
         # Test basic connection
         result = await r.ping()
-        print(f"✅ Async connection successful! Ping result: {result}")
+        _log(report, "Async connection successful, ping result", True, result)
         
         # Test basic operations
         await r.set("async_test_key", "async_test_value")
         value = await r.get("async_test_key")
-        print(f"✅ Async Set/Get test successful: {value.decode()}")
+        _log(report, "Async Set/Get test successful", True, value)
         
         # Clean up
         await r.delete("async_test_key")
         
-        # Close connection
-        await r.close()
-        
         return True
         
     except Exception as e:
-        print(f"❌ Async connection failed: {e}")
+        _log(report, "Async connection failed", False, e)
         return False
 
 
-def test_redis_info():
+def test_redis_info(r=_R, report: Optional[List[str]] = None):
     """Test and display Redis server information"""
-    print("\n🔍 Testing Redis server information...")
-    
     try:
-        r = redis.from_url(settings.redis_url)
-        
         # Get Redis info
         info = r.info()
         
-        print(f"📊 Redis Version: {info.get('redis_version', 'Unknown')}")
-        print(f"🖥️  OS: {info.get('os', 'Unknown')}")
-        print(f"🏗️  Architecture: {info.get('arch_bits', 'Unknown')} bits")
-        print(f"🔗 Connected Clients: {info.get('connected_clients', 'Unknown')}")
-        print(f"💾 Used Memory: {info.get('used_memory_human', 'Unknown')}")
-        print(f"💾 Peak Memory: {info.get('used_memory_peak_human', 'Unknown')}")
-        print(f"🗄️  Database Keys: {info.get('db0', 'Unknown')}")
+        _log(report, "Redis Version", True, info.get('redis_version', 'Unknown'))
+        _log(report, "OS", True, info.get('os', 'Unknown'))
+        _log(report, "Architecture", True, f"{info.get('arch_bits', 'Unknown')} bits")
+        _log(report, "Connected Clients", True, info.get('connected_clients', 'Unknown'))
+        _log(report, "Used Memory", True, info.get('used_memory_human', 'Unknown'))
+        _log(report, "Peak Memory", True, info.get('used_memory_peak_human', 'Unknown'))
+        _log(report, "Database Keys", True, info.get('db0', 'Unknown'))
         
-        # Get server info
-        server_info = r.info('server')
-        print(f"🌐 Server Port: {server_info.get('tcp_port', 'Unknown')}")
-        print(f"⏰ Uptime: {server_info.get('uptime_in_seconds', 'Unknown')} seconds")
+        # The default INFO payload already carries the server section
+        _log(report, "Server Port", True, info.get('tcp_port', 'Unknown'))
+        _log(report, "Uptime", True, f"{info.get('uptime_in_seconds', 'Unknown')} seconds")
         
         return True
         
     except Exception as e:
-        print(f"❌ Redis info test failed: {e}")
+        _log(report, "Redis info test failed", False, e)
         return False
 
 
-def test_redis_operations():
+def test_redis_operations(r=_R, report: Optional[List[str]] = None):
     """Test various Redis operations"""
-    print("\n🔍 Testing Redis operations...")
-    
     try:
-        r = redis.from_url(settings.redis_url)
-        
-        # Test string operations
-        r.set("string_key", "hello world")
-        value = r.get("string_key")
-        print(f"✅ String operations: {value.decode()}")
-        
-        # Test list operations
-        r.lpush("list_key", "item1", "item2", "item3")
-        items = r.lrange("list_key", 0, -1)
-        print(f"✅ List operations: {[item.decode() for item in items]}")
-        
-        # Test hash operations
-        r.hset("hash_key", mapping={"field1": "value1", "field2": "value2"})
-        hash_data = r.hgetall("hash_key")
-        print(f"✅ Hash operations: {hash_data}")
-        
-        # Test set operations
-        r.sadd("set_key", "member1", "member2", "member3")
-        members = r.smembers("set_key")
-        print(f"✅ Set operations: {[member.decode() for member in members]}")
-        
-        # Test sorted set operations
-        r.zadd("zset_key", {"score1": 1.0, "score2": 2.0, "score3": 3.0})
-        zset_data = r.zrange("zset_key", 0, -1, withscores=True)
-        print(f"✅ Sorted set operations: {zset_data}")
-        
-        # Clean up
-        r.delete("string_key", "list_key", "hash_key", "set_key", "zset_key")
+        # Write every data type in one round trip (no MULTI/EXEC needed)
+        pipe = r.pipeline(transaction=False)
+        pipe.set("string_key", "hello world")
+        pipe.lpush("list_key", "item1", "item2", "item3")
+        pipe.hset("hash_key", mapping={"field1": "value1", "field2": "value2"})
+        pipe.sadd("set_key", "member1", "member2", "member3")
+        pipe.zadd("zset_key", {"score1": 1.0, "score2": 2.0, "score3": 3.0})
+        pipe.execute()
+        
+        # Read them back (and clean up) in a second round trip
+        pipe = r.pipeline(transaction=False)
+        pipe.get("string_key")
+        pipe.lrange("list_key", 0, -1)
+        pipe.hgetall("hash_key")
+        pipe.smembers("set_key")
+        pipe.zrange("zset_key", 0, -1, withscores=True)
+        pipe.delete("string_key", "list_key", "hash_key", "set_key", "zset_key")
+        value, items, hash_data, members, zset_data, _ = pipe.execute()
+        
+        _log(report, "String operations", True, value)
+        _log(report, "List operations", True, items)
+        _log(report, "Hash operations", True, hash_data)
+        _log(report, "Set operations", True, list(members))
+        _log(report, "Sorted set operations", True, zset_data)
         
         return True
         
     except Exception as e:
-        print(f"❌ Redis operations test failed: {e}")
+        _log(report, "Redis operations test failed", False, e)
         return False
 
 
-def test_redis_pubsub():
+def test_redis_pubsub(r=_R, report: Optional[List[str]] = None):
     """Test Redis pub/sub functionality"""
-    print("\n🔍 Testing Redis pub/sub...")
-    
     try:
-        r = redis.from_url(settings.redis_url)
-        
-        # Create pubsub object
-        pubsub = r.pubsub()
+        # Create pubsub object; subscribe confirmations are filtered out
+        pubsub = r.pubsub(ignore_subscribe_messages=True)
         
         # Subscribe to a channel
         pubsub.subscribe("test_channel")
@@ -156,12 +144,15 @@ def test_redis_pubsub():
         # Publish a message
         r.publish("test_channel", "test message")
         
-        # Get message (with timeout)
-        message = pubsub.get_message(timeout=1)
+        # get_message returns as soon as data arrives; the deadline only bounds a lost message
+        message = None
+        deadline = time.monotonic() + 1
+        while message is None and time.monotonic() < deadline:
+            message = pubsub.get_message(timeout=max(0.0, deadline - time.monotonic()))
         if message and message['type'] == 'message':
-            print(f"✅ Pub/sub test successful: {message['data'].decode()}")
+            _log(report, "Pub/sub test successful", True, message['data'])
         else:
-            print("⚠️  No message received in pub/sub test")
+            _log(report, "No message received in pub/sub test", False)
         
         # Unsubscribe and close
         pubsub.unsubscribe("test_channel")
@@ -170,17 +161,13 @@ def test_redis_pubsub():
         return True
         
     except Exception as e:
-        print(f"❌ Redis pub/sub test failed: {e}")
+        _log(report, "Redis pub/sub test failed", False, e)
         return False
 
 
-def test_redis_pipeline():
+def test_redis_pipeline(r=_R, report: Optional[List[str]] = None):
     """Test Redis pipeline functionality"""
-    print("\n🔍 Testing Redis pipeline...")
-    
     try:
-        r = redis.from_url(settings.redis_url)
-        
         # Create pipeline
         pipe = r.pipeline()
         
@@ -193,7 +180,7 @@ def test_redis_pipeline():
         # Execute pipeline
         results = pipe.execute()
         
-        print(f"✅ Pipeline test successful: {results}")
+        _log(report, "Pipeline test successful", True, results)
         
         # Clean up
         r.delete("pipeline_key1", "pipeline_key2")
@@ -201,97 +188,88 @@ def test_redis_pipeline():
         return True
         
     except Exception as e:
-        print(f"❌ Redis pipeline test failed: {e}")
+        _log(report, "Redis pipeline test failed", False, e)
         return False
 
 
-def test_redis_connection_pool():
+def test_redis_connection_pool(r=_R, report: Optional[List[str]] = None):
     """Test Redis connection pool"""
-    print("\n🔍 Testing Redis connection pool...")
-    
     try:
-        # Create connection pool
-        pool = redis.ConnectionPool.from_url(settings.redis_url, max_connections=10)
-        
-        # Test multiple connections
-        connections = []
+        # Each command checks a connection out of the shared pool and returns it
         for i in range(3):
-            conn = redis.Redis(connection_pool=pool)
-            conn.set(f"pool_key_{i}", f"value_{i}")
-            value = conn.get(f"pool_key_{i}")
-            print(f"🔗 Pool connection {i+1}: {value.decode()}")
-            connections.append(conn)
+            r.set(f"pool_key_{i}", f"value_{i}")
+            value = r.get(f"pool_key_{i}")
+            _log(report, f"Pool connection {i+1}", True, value)
         
         # Clean up
-        for i in range(3):
-            connections[i].delete(f"pool_key_{i}")
+        r.delete(*(f"pool_key_{i}" for i in range(3)))
         
-        print("✅ Connection pool test successful")
+        _log(report, "Connection pool test successful", True)
         return True
         
     except Exception as e:
-        print(f"❌ Redis connection pool test failed: {e}")
+        _log(report, "Redis connection pool test failed", False, e)
         return False
 
 
-async def test_redis_streams():
+async def check_redis_streams(r, report: List[str]):
     """Test Redis streams (if available)"""
-    print("\n🔍 Testing Redis streams...")
-    
     try:
-        r = redis_async.from_url(settings.redis_url)
-        
         # Test stream operations
         stream_key = "test_stream"
         
-        # Add entry to stream
-        entry_id = await r.xadd(stream_key, {"field1": "value1", "field2": "value2"})
-        print(f"✅ Stream add successful: {entry_id}")
+        # Add, read back and clean up in one round trip; MAXLEN keeps the stream bounded
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.xadd(stream_key, {"field1": "value1", "field2": "value2"}, maxlen=1, approximate=True)
+            pipe.xread({stream_key: "0"}, count=1)
+            pipe.delete(stream_key)
+            entry_id, entries, _ = await pipe.execute()
         
-        # Read from stream
-        entries = await r.xread({stream_key: "0"}, count=1)
+        _log(report, "Stream add successful", True, entry_id)
         if entries:
-            print(f"✅ Stream read successful: {entries}")
-        
-        # Clean up
-        await r.delete(stream_key)
-        await r.close()
+            _log(report, "Stream read successful", True, entries)
         
         return True
         
     except Exception as e:
-        print(f"❌ Redis streams test failed: {e}")
+        _log(report, "Redis streams test failed", False, e)
         return False
 
 
+async def _async_main(async_checks, reports: List[List[str]]):
+    """Run the async checks concurrently on one shared client, each with its own report"""
+    r = redis_async.from_url(settings.redis_url, max_connections=10, decode_responses=True)
+    try:
+        return await asyncio.gather(*(check(r, report) for check, report in zip(async_checks, reports)))
+    finally:
+        await r.aclose()
+
+
 def main():
     """Run all Redis tests"""
     print("🚀 Starting Redis Connection Tests")
     print("=" * 50)
     
-    # Test sync connection
-    sync_success = test_sync_connection()
-    
-    # Test async connection
-    async_success = asyncio.run(test_async_connection())
-    
-    # Test Redis info
-    info_success = test_redis_info()
-    
-    # Test Redis operations
-    ops_success = test_redis_operations()
-    
-    # Test Redis pub/sub
-    pubsub_success = test_redis_pubsub()
-    
-    # Test Redis pipeline
-    pipeline_success = test_redis_pipeline()
-    
-    # Test Redis connection pool
-    pool_success = test_redis_connection_pool()
+    # The sync tests are independent and network-bound, so overlap them on threads
+    sync_tests = [test_sync_connection, test_redis_info, test_redis_operations,
+                  test_redis_pubsub, test_redis_pipeline, test_redis_connection_pool]
+    async_checks = [check_async_connection, check_redis_streams]
+    # Each test writes its own report, so joining them keeps declaration order
+    # however the concurrent tests interleaved
+    sync_reports: List[List[str]] = [[] for _ in sync_tests]
+    async_reports: List[List[str]] = [[] for _ in async_checks]
+    with ThreadPoolExecutor(max_workers=len(sync_tests)) as executor:
+        futures = [executor.submit(test, _R, report) for test, report in zip(sync_tests, sync_reports)]
+        
+        # Async connection and streams run on this thread meanwhile
+        async_success, streams_success = asyncio.run(_async_main(async_checks, async_reports))
+        
+        sync_success, info_success, ops_success, pubsub_success, pipeline_success, pool_success = (
+            future.result() for future in futures
+        )
     
-    # Test Redis streams
-    streams_success = asyncio.run(test_redis_streams())
+    # One write for the whole report
+    sys.stdout.write("".join(line for report in sync_reports + async_reports for line in report))
     
     # Summary
     print("\n" + "=" * 50)
@@ -3,55 +3,117 @@
 Test script for evaluation worker
 Run this to test your worker functionality
 """
-import random
 import asyncio
 import sys
-import json
 import time
+import tracemalloc
 import uuid
 from typing import Dict, Any, List
-import redis
-import redis.asyncio as redis_async
+# Heavy imports (redis, SQLAlchemy, app services and models) are deferred to where they're used
 from app.config import settings
-from app.services.redis_queue import RedisQueue
-from app.services.evaluation_worker import EvaluationWorker
-from app.services.evaluator_service import evaluator_service
-from app.database import AsyncSessionLocal, test_async_connection
-from app.models.experiment import ExperimentRun, RunStatus, Experiment, ExperimentStatus
-import pdb
+
+# Test experiment configs, built once at import rather than per test run
+_MODEL_CONFIG = {
+    "provider": "openai",
+    "model": "gpt-3.5-turbo",
+    "temperature": 0.7
+}
+_EVAL_CONFIG = {
+    "metrics": ["accuracy", "relevance"],
+    "thresholds": {"accuracy": 0.8}
+}
+
+# Evaluator config shared by every batch-test job, built once rather than per job
+_EXACT_MATCH_CONFIGS = [
+    {
+        "evaluator_type": "exact_match",
+        "config": {"case_sensitive": False}
+    }
+]
+
+# Fields shared by every batch-test job
+_BATCH_JOB_TEMPLATE = {"evaluator_configs": _EXACT_MATCH_CONFIGS}
+
+
+def _batch_jobs(run_prefix: str, input_prefix: str, count: int) -> List[Dict[str, Any]]:
+    """Build count single-case exact-match jobs from the shared template"""
+    outputs = [f"Result {i}" for i in range(count)]
+    return [
+        {
+            **_BATCH_JOB_TEMPLATE,
+            "job_id": uuid.uuid4().hex,
+            "experiment_run_id": f"{run_prefix}-{i}",
+            # Expected and actual share one string since they're meant to match
+            "test_cases": [{"input": f"{input_prefix} {i}", "expected_output": output, "actual_output": output}]
+        }
+        for i, output in enumerate(outputs)
+    ]
+
 
 class WorkerTester:
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        import redis.asyncio as redis_async
+        from app.database import AsyncSessionLocal
+        from app.services.redis_queue import RedisQueue
+        
         self.redis_url = settings.redis_url
-        self.queue_service = RedisQueue()
-        self.db = AsyncSessionLocal()
-        self.worker = EvaluationWorker(self.db)
+        # One pool for the connection check and the queue service
+        self.redis = redis_async.Redis(
+            connection_pool=redis_async.ConnectionPool.from_url(self.redis_url, max_connections=32)
+        )
+        self.queue_service = RedisQueue(redis_client=self.redis)
+        # Tests open their own short-lived sessions; the worker gets one in run_all_tests
+        self.session_factory = AsyncSessionLocal
+        self.worker = None
         self.test_results = {}
+        # Per-test output is buffered (and kept out of timed regions) unless verbose
+        self.verbose = verbose
+        self._log_buf: List[str] = []
         
+    def _out(self, message: str):
+        """Print immediately in verbose mode, otherwise buffer until flush_log"""
+        if self.verbose:
+            print(message)
+        else:
+            self._log_buf.append(message)
+
+    def flush_log(self):
+        """Write any buffered output in a single write"""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            sys.stdout.flush()
+            self._log_buf.clear()
+
+    def _private_queue(self):
+        """Return a RedisQueue on a throwaway queue name"""
+        # A test then pops back exactly the jobs it pushed, never real jobs or another test's
+        from app.services.redis_queue import RedisQueue
+        return RedisQueue(redis_client=self.redis, queue_name=f"test_evaluation_jobs:{uuid.uuid4().hex}")
+
     def log_test(self, test_name: str, success: bool, message: str = ""):
         """Log test result"""
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{test_name}: {status}")
+        self._out(f"{test_name}: {status}")
         if message:
-            print(f"   {message}")
+            self._out(f"   {message}")
         self.test_results[test_name] = success
         return success
 
     async def test_redis_connection(self) -> bool:
         """Test Redis connection for worker"""
-        print("\n🔍 Testing Redis connection for worker...")
+        self._out("\n🔍 Testing Redis connection for worker...")
         
         try:
-            r = redis_async.from_url(self.redis_url)
-            await r.ping()
-            await r.close()
+            await self.redis.ping()
             return self.log_test("Redis Connection", True, "Connected successfully")
         except Exception as e:
             return self.log_test("Redis Connection", False, f"Error: {e}")
 
     async def test_database_connection(self) -> bool:
         """Test PostgreSQL database connection for worker"""
-        print("\n🔍 Testing PostgreSQL database connection for worker...")
+        self._out("\n🔍 Testing PostgreSQL database connection for worker...")
+        
+        from app.database import test_async_connection
         
         try:
             # Test async database connection
@@ -65,19 +127,19 @@ class WorkerTester:
 
     async def test_database_operations(self) -> bool:
         """Test basic database operations"""
-        print("\n🔍 Testing database operations...")
+        self._out("\n🔍 Testing database operations...")
         
         try:
             from sqlalchemy import text
             
             # Test database session
-            async with self.db as session:
+            async with self.session_factory() as session:
                 # Test simple query
 
                 result = await session.execute(text("SELECT 1 as test_value"))
                 row = result.fetchone()
                 if row and row[0] == 1:
-                    print("✅ Database session and query working")
+                    self._out("✅ Database session and query working")
                     return self.log_test("Database Operations", True, "Session and query successful")
                 else:
                     return self.log_test("Database Operations", False, "Query result unexpected")
@@ -87,22 +149,22 @@ class WorkerTester:
 
     async def test_queue_service(self) -> bool:
         """Test queue service functionality"""
-        print("\n🔍 Testing queue service...")
+        self._out("\n🔍 Testing queue service...")
         
         try:
             # Test enqueue
             test_job = {
-                "job_id": str(uuid.uuid4()),
+                "job_id": uuid.uuid4().hex,
                 "data": {"test": "data"}
             }
             
             await self.queue_service.enqueue_job(test_job)
-            print("✅ Job enqueued successfully")
+            self._out("✅ Job enqueued successfully")
             
             # Test dequeue
             job = await self.queue_service.dequeue_job("test_queue")
             if job and job.get("data", {}).get("test") == "data":
-                print("✅ Job dequeued successfully")
+                self._out("✅ Job dequeued successfully")
                 return self.log_test("Queue Service", True, "Enqueue/Dequeue working")
             else:
                 return self.log_test("Queue Service", False, "Dequeue failed")
@@ -112,7 +174,9 @@ class WorkerTester:
 
     async def test_evaluator_service(self) -> bool:
         """Test evaluator service functionality"""
-        print("\n🔍 Testing evaluator service...")
+        self._out("\n🔍 Testing evaluator service...")
+        
+        from app.services.evaluator_service import evaluator_service
         
         try:
             # Test exact match evaluator
@@ -120,21 +184,21 @@ class WorkerTester:
             result = await evaluator_service.evaluate_single(
                 "exact_match", exact_config, "hello", "HELLO"
             )
-            print(f"✅ Exact match evaluator: {result}")
+            self._out(f"✅ Exact match evaluator: {result}")
             
             # Test semantic similarity evaluator
             semantic_config = {"threshold": 0.8}
             result = await evaluator_service.evaluate_single(
                 "semantic_similarity", semantic_config, "hello world", "hi world"
             )
-            print(f"✅ Semantic similarity evaluator: {result}")
+            self._out(f"✅ Semantic similarity evaluator: {result}")
             
             # Test latency evaluator
             latency_config = {"max_latency_ms": 1000}
             result = await evaluator_service.evaluate_single(
                 "latency", latency_config, "test", "test", execution_time_ms=500
             )
-            print(f"✅ Latency evaluator: {result}")
+            self._out(f"✅ Latency evaluator: {result}")
             
             return self.log_test("Evaluator Service", True, "All evaluators created successfully")
             
@@ -143,59 +207,53 @@ class WorkerTester:
 
     async def test_simple_evaluation_job(self) -> bool:
         """Test simple evaluation job processing"""
-        print("\n🔍 Testing simple evaluation job...")
+        self._out("\n🔍 Testing simple evaluation job...")
         
-        test_run = None
-        test_experiment = None
+        from sqlalchemy import delete, insert
+        from app.models.experiment import ExperimentRun, RunStatus, Experiment, ExperimentStatus
+        from app.models.evaluation import EvaluationResult
+        
+        experiment_name = "Test Evaluation Experiment"
+        run_id = None
+        experiment_id = None
+        job_id = None
         try:
-            # Create a test experiment run record in the database
-            async with self.db as session:
+            # Create a test experiment and run in one transaction; RETURNING hands back the IDs
+            async with self.session_factory() as session:
                 # First create a test experiment
-                test_experiment = Experiment(
-                    name="Test Evaluation Experiment",
-                    description="Test experiment for worker testing",
-                    status=ExperimentStatus.ACTIVE,
-                    prompt_id=1,  # Assuming prompt ID 1 exists
-                    dataset_id=1,  # Assuming dataset ID 1 exists
-                    model_configuration={
-                        "provider": "openai",
-                        "model": "gpt-3.5-turbo",
-                        "temperature": 0.7
-                    },
-                    evaluation_config={
-                        "metrics": ["accuracy", "relevance"],
-                        "thresholds": {"accuracy": 0.8}
-                    },
-                    project_id=1  # Assuming project ID 1 exists
-                )
+                experiment_id = (await session.execute(
+                    insert(Experiment).values(
+                        name=experiment_name,
+                        description="Test experiment for worker testing",
+                        status=ExperimentStatus.ACTIVE,
+                        prompt_id=1,  # Assuming prompt ID 1 exists
+                        dataset_id=1,  # Assuming dataset ID 1 exists
+                        model_configuration=_MODEL_CONFIG,
+                        evaluation_config=_EVAL_CONFIG,
+                        project_id=1  # Assuming project ID 1 exists
+                    ).returning(Experiment.id)
+                )).scalar_one()
                 
-                session.add(test_experiment)
-                await session.commit()
-                await session.refresh(test_experiment)
-                
-                print(f"✅ Created test experiment: {test_experiment.name} (ID: {test_experiment.id})")
+                self._out(f"✅ Created test experiment: {experiment_name} (ID: {experiment_id})")
                 
-                # Create a test experiment run
-                test_run = ExperimentRun(
-                    id=str(uuid.uuid4()),
-                    status=RunStatus.PENDING,
-                    total_items=2,
-                    completed_items=0,
-                    failed_items=0,
-                    experiment_id=test_experiment.id
-                )
+                # Create a test experiment run; RETURNING reads back the ID from the column's gen_random_uuid() server default
+                run_id = (await session.execute(
+                    insert(ExperimentRun).values(
+                        status=RunStatus.PENDING,
+                        total_items=2,
+                        completed_items=0,
+                        failed_items=0,
+                        experiment_id=experiment_id
+                    ).returning(ExperimentRun.id)
+                )).scalar_one()
                 
-                session.add(test_run)
                 await session.commit()
-                await session.refresh(test_run)
                 
-                print(f"✅ Created experiment run: {test_run.id} (ID: {test_run.id})")
+                self._out(f"✅ Created experiment run: {run_id}")
                 
-                # Use the created run ID for the test job
-                job_id = str(uuid.uuid4())
+                # Use the created run ID for the test job; the queue assigns its job ID
                 test_job = {
-                    "job_id": job_id,
-                    "experiment_run_id": test_run.id,
+                    "experiment_run_id": run_id,
                     "evaluator_configs": [
                         {
                             "evaluator_type": "exact_match",
@@ -222,14 +280,12 @@ class WorkerTester:
                     ]
 
                 }
-                test_job["evaluator_configs"] = json.dumps(test_job["evaluator_configs"])
-                test_job['test_cases'] = json.dumps(test_job['test_cases'])
-                test_job['dataset_ids'] = json.dumps(test_job['dataset_ids'])
             
-            # Enqueue job
-            await self.queue_service.enqueue_job(test_job)
+            # Reserve the job for this worker in one round trip: it is stored (and gets its
+            # job ID) like any queued job, but never sits on the queue for another worker
+            job_id = await self.queue_service.reserve_job(test_job)
 
-            print(f"✅ Job enqueued: {job_id}")
+            self._out(f"✅ Job reserved: {job_id}")
             
             # Process job
             result = await self.worker.process_evaluation_job(test_job)
@@ -237,8 +293,8 @@ class WorkerTester:
             # pdb.set_trace()
             if result and result.get("status") == "completed":
                 results = result.get("results", [])
-                print(f"✅ Job processed successfully: {len(results)} results")
-                print(f"✅ Job result: {result}")
+                self._out(f"✅ Job processed successfully: {len(results)} results")
+                self._out(f"✅ Job result: {result}")
                 return self.log_test("Simple Evaluation Job", True, f"Processed {len(results)} test cases")
             else:
                 return self.log_test("Simple Evaluation Job", False, f"Processing failed: {result}")
@@ -247,30 +303,38 @@ class WorkerTester:
             # pdb.set_trace()
             return self.log_test("Simple Evaluation Job", False, f"Error: {e}")
         finally:
+            # Clean up: Delete the reserved job's Redis keys
+            if job_id:
+                try:
+                    await self.queue_service.delete_jobs([job_id])
+                except Exception as cleanup_error:
+                    self._out(f"⚠️  Failed to cleanup test job: {cleanup_error}")
+            
             # Clean up: Delete the test run and experiment records
-            if test_run or test_experiment:
+            if run_id or experiment_id:
                 try:
-                    async with self.db as session:
-                        if test_run:
-                            # Delete the test run
-                            await session.delete(test_run)
-                            print(f"✅ Cleaned up test run: {test_run.id}")
+                    async with self.session_factory() as session:
+                        # Plain DELETEs skip the ORM's load-then-delete; results go first
+                        # since the run's ORM cascade no longer removes them
+                        if run_id:
+                            await session.execute(delete(EvaluationResult).where(EvaluationResult.experiment_run_id == run_id))
+                            await session.execute(delete(ExperimentRun).where(ExperimentRun.id == run_id))
+                            self._out(f"✅ Cleaned up test run: {run_id}")
                         
-                        if test_experiment:
-                            # Delete the test experiment
-                            await session.delete(test_experiment)
-                            print(f"✅ Cleaned up test experiment: {test_experiment.name}")
+                        if experiment_id:
+                            await session.execute(delete(Experiment).where(Experiment.id == experiment_id))
+                            self._out(f"✅ Cleaned up test experiment: {experiment_name}")
                         
                         await session.commit()
                 except Exception as cleanup_error:
-                    print(f"⚠️  Failed to cleanup test data: {cleanup_error}")
+                    self._out(f"⚠️  Failed to cleanup test data: {cleanup_error}")
 
     async def test_complex_evaluation_job(self) -> bool:
         """Test complex evaluation job with multiple evaluators"""
-        print("\n🔍 Testing complex evaluation job...")
+        self._out("\n🔍 Testing complex evaluation job...")
         
         try:
-            job_id = str(uuid.uuid4())
+            job_id = uuid.uuid4().hex
             test_job = {
                 "job_id": job_id,
                 "experiment_run_id": "test-run-complex",
@@ -318,7 +382,7 @@ class WorkerTester:
             
             if result and result.get("status") == "completed":
                 results = result.get("results", [])
-                print(f"✅ Complex job processed: {len(results)} results")
+                self._out(f"✅ Complex job processed: {len(results)} results")
                 
                 # Check if all evaluators ran
                 evaluator_types = set()
@@ -326,7 +390,7 @@ class WorkerTester:
                     for eval_result in test_result.get("evaluator_results", []):
                         evaluator_types.add(eval_result.get("evaluator_type"))
                 
-                print(f"✅ Evaluators used: {evaluator_types}")
+                self._out(f"✅ Evaluators used: {evaluator_types}")
                 return self.log_test("Complex Evaluation Job", True, f"Processed with {len(evaluator_types)} evaluators")
             else:
                 return self.log_test("Complex Evaluation Job", False, f"Processing failed: {result}")
@@ -336,12 +400,12 @@ class WorkerTester:
 
     async def test_worker_error_handling(self) -> bool:
         """Test worker error handling"""
-        print("\n🔍 Testing worker error handling...")
+        self._out("\n🔍 Testing worker error handling...")
         
         try:
             # Test with invalid job data
             invalid_job = {
-                "job_id": str(uuid.uuid4()),
+                "job_id": uuid.uuid4().hex,
                 "experiment_run_id": "test-error",
                 "evaluator_configs": [
                     {
@@ -355,7 +419,7 @@ class WorkerTester:
             result = await self.worker.process_job(invalid_job)
             
             if result and result.get("status") == "failed":
-                print("✅ Error handling works for invalid evaluator")
+                self._out("✅ Error handling works for invalid evaluator")
                 return self.log_test("Error Handling", True, "Invalid evaluator handled correctly")
             else:
                 return self.log_test("Error Handling", False, "Expected error not caught")
@@ -365,76 +429,58 @@ class WorkerTester:
 
     async def test_worker_performance(self) -> bool:
         """Test worker performance with multiple jobs"""
-        print("\n🔍 Testing worker performance...")
+        self._out("\n🔍 Testing worker performance...")
         
+        job_ids = []
         try:
             start_time = time.time()
             
             # Create multiple simple jobs
-            jobs = []
-            for i in range(5):
-                job = {
-                    "job_id": str(uuid.uuid4()),
-                    "experiment_run_id": f"perf-test-{i}",
-                    "evaluator_configs": [
-                        {
-                            "evaluator_type": "exact_match",
-                            "config": {"case_sensitive": False}
-                        }
-                    ],
-                    "test_cases": [
-                        {
-                            "input": f"Test {i}",
-                            "expected_output": f"Result {i}",
-                            "actual_output": f"Result {i}"
-                        }
-                    ]
-                }
-                jobs.append(job)
+            jobs = _batch_jobs("perf-test", "Test", 5)
+            
+            # Enqueue all jobs in a single round trip, then pop them back as one batch
+            queue = self._private_queue()
+            job_ids = await queue.enqueue_jobs_bulk(jobs)
+            jobs = await queue.dequeue_jobs(len(jobs))
+            
+            # Process all jobs concurrently, bounded so downstream services aren't flooded
+            semaphore = asyncio.Semaphore(5)
+            
+            async def run_job(job):
+                async with semaphore:
+                    return await self.worker.process_job(job)
             
-            # Process all jobs
-            results = []
-            for job in jobs:
-                result = await self.worker.process_job(job)
-                results.append(result)
+            results = await asyncio.gather(*(run_job(job) for job in jobs), return_exceptions=True)
             
             end_time = time.time()
             total_time = end_time - start_time
             
-            successful_jobs = sum(1 for r in results if r and r.get("status") == "completed")
-            print(f"✅ Processed {successful_jobs}/{len(jobs)} jobs in {total_time:.2f}s")
+            # list.count tallies in C; exceptions from gather count as failures
+            successful_jobs = [r.get("status") if isinstance(r, dict) else None for r in results].count("completed")
+            self._out(f"✅ Processed {successful_jobs}/{len(jobs)} jobs in {total_time:.2f}s")
             
             return self.log_test("Worker Performance", True, f"Processed {successful_jobs} jobs in {total_time:.2f}s")
             
         except Exception as e:
             return self.log_test("Worker Performance", False, f"Error: {e}")
+        finally:
+            # Dequeueing leaves each job's body and status keys behind
+            if job_ids:
+                await queue.delete_jobs(job_ids)
 
     async def test_worker_concurrent_processing(self) -> bool:
         """Test concurrent job processing"""
-        print("\n🔍 Testing concurrent job processing...")
+        self._out("\n🔍 Testing concurrent job processing...")
         
+        job_ids = []
         try:
             # Create multiple jobs
-            jobs = []
-            for i in range(3):
-                job = {
-                    "job_id": str(uuid.uuid4()),
-                    "experiment_run_id": f"concurrent-test-{i}",
-                    "evaluator_configs": [
-                        {
-                            "evaluator_type": "exact_match",
-                            "config": {"case_sensitive": False}
-                        }
-                    ],
-                    "test_cases": [
-                        {
-                            "input": f"Concurrent test {i}",
-                            "expected_output": f"Result {i}",
-                            "actual_output": f"Result {i}"
-                        }
-                    ]
-                }
-                jobs.append(job)
+            jobs = _batch_jobs("concurrent-test", "Concurrent test", 3)
+            
+            # Enqueue all jobs in a single round trip, then pop them back as one batch
+            queue = self._private_queue()
+            job_ids = await queue.enqueue_jobs_bulk(jobs)
+            jobs = await queue.dequeue_jobs(len(jobs))
             
             # Process jobs concurrently
             start_time = time.time()
@@ -443,59 +489,60 @@ class WorkerTester:
             end_time = time.time()
             
             concurrent_time = end_time - start_time
-            successful_jobs = sum(1 for r in results if r and r.get("status") == "completed")
+            successful_jobs = [r.get("status") if r else None for r in results].count("completed")
             
-            print(f"✅ Concurrent processing: {successful_jobs}/{len(jobs)} jobs in {concurrent_time:.2f}s")
+            self._out(f"✅ Concurrent processing: {successful_jobs}/{len(jobs)} jobs in {concurrent_time:.2f}s")
             
             return self.log_test("Concurrent Processing", True, f"Processed {successful_jobs} jobs concurrently")
             
         except Exception as e:
             return self.log_test("Concurrent Processing", False, f"Error: {e}")
+        finally:
+            # Dequeueing leaves each job's body and status keys behind
+            if job_ids:
+                await queue.delete_jobs(job_ids)
 
     async def test_worker_memory_usage(self) -> bool:
         """Test worker memory usage"""
-        print("\n🔍 Testing worker memory usage...")
+        self._out("\n🔍 Testing worker memory usage...")
         
         try:
-            import psutil
-            import os
-            
-            process = psutil.Process(os.getpid())
-            initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+            # Large payloads built once and shared by every test case, so the trace reflects the worker
+            large_input = "x" * 1000
+            large_output = "y" * 1000
             
             # Process a large job
             large_job = {
-                "job_id": str(uuid.uuid4()),
+                "job_id": "memory-test-job",
                 "experiment_run_id": "memory-test",
-                "evaluator_configs": [
-                    {
-                        "evaluator_type": "exact_match",
-                        "config": {"case_sensitive": False}
-                    }
-                ],
-                "test_cases": [
+                "evaluator_configs": _EXACT_MATCH_CONFIGS,
+                # Streamed as a generator; the worker consumes it a batch at a time
+                "test_cases": (
                     {
-                        "input": "x" * 1000,  # Large input
-                        "expected_output": "y" * 1000,  # Large output
-                        "actual_output": "y" * 1000
+                        "input": large_input,
+                        "expected_output": large_output,
+                        "actual_output": large_output
                     } for _ in range(100)  # Many test cases
-                ]
+                )
             }
             
-            result = await self.worker.process_job(large_job)
+            # tracemalloc counts only Python allocations made while the job runs
+            tracemalloc.start()
+            try:
+                result = await self.worker.process_job(large_job)
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
             
-            final_memory = process.memory_info().rss / 1024 / 1024  # MB
-            memory_increase = final_memory - initial_memory
+            current_mb = current / 1024 / 1024
+            peak_mb = peak / 1024 / 1024
+            self._out(f"✅ Memory usage: {current_mb:.1f}MB retained, {peak_mb:.1f}MB peak")
             
-            print(f"✅ Memory usage: {initial_memory:.1f}MB -> {final_memory:.1f}MB (+{memory_increase:.1f}MB)")
-            
-            if memory_increase < 50:  # Less than 50MB increase
-                return self.log_test("Memory Usage", True, f"Memory increase: {memory_increase:.1f}MB")
+            if peak_mb < 50:  # Less than 50MB peak
+                return self.log_test("Memory Usage", True, f"Peak traced memory: {peak_mb:.1f}MB")
             else:
-                return self.log_test("Memory Usage", False, f"High memory usage: {memory_increase:.1f}MB")
+                return self.log_test("Memory Usage", False, f"High memory usage: {peak_mb:.1f}MB")
                 
-        except ImportError:
-            return self.log_test("Memory Usage", False, "psutil not installed")
         except Exception as e:
             return self.log_test("Memory Usage", False, f"Error: {e}")
 
@@ -518,17 +565,23 @@ class WorkerTester:
             # self.test_worker_error_handling,
             # self.test_worker_performance,
             # self.test_worker_concurrent_processing,
+            # self.test_worker_memory_usage,
         ]
         
-        # Add memory test if psutil is available
-        # try:
-        #     import psutil
-        #     tests.append(self.test_worker_memory_usage)
-        # except ImportError:
-        #     print("⚠️  psutil not installed, skipping memory usage test")
-        
-        for test in tests:
-            await test()
+        try:
+            from app.services.evaluation_worker import EvaluationWorker
+            
+            # One session and one HTTP client for the worker, held for the whole run
+            async with self.session_factory() as db, EvaluationWorker(db, redis_client=self.redis) as worker:
+                self.worker = worker
+                # Tests are I/O-bound and independent (each opens its own DB session), so overlap them
+                results = await asyncio.gather(*(test() for test in tests), return_exceptions=True)
+                for test, result in zip(tests, results):
+                    if isinstance(result, Exception):
+                        self.log_test(test.__name__, False, f"Error: {result}")
+        finally:
+            self.flush_log()
+            await self.redis.aclose()
         
         return self.test_results
 
@@ -538,7 +591,7 @@ class WorkerTester:
         print("📋 Worker Test Summary:")
         print("=" * 60)
         
-        passed = sum(1 for success in self.test_results.values() if success)
+        passed = list(self.test_results.values()).count(True)
         total = len(self.test_results)
         
         for test_name, success in self.test_results.items():
@@ -573,7 +626,7 @@ async def main():
         settings.redis_url = args.redis_url
     
     # Create tester
-    tester = WorkerTester()
+    tester = WorkerTester(verbose=args.verbose)
     
     # Run tests
     results = await tester.run_all_tests()
@@ -586,4 +639,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use the libuv event loop when available (installed with uvicorn[standard]);
+    # only when run as a script, so importing this module under pytest leaves the loop policy alone
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main()) 
\ No newline at end of file
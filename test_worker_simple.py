@@ -3,95 +3,127 @@
 Test script for evaluation worker
 Run this to test your worker functionality
 """
-import random
 import asyncio
 import sys
-import json
-import time
-import uuid
-from typing import Dict, Any, List
-import redis
-import redis.asyncio as redis_async
+from typing import Dict, List
+import pytest
+from sqlalchemy import delete, exists, insert, select
 from app.config import settings
 from app.services.redis_queue import RedisQueue
 from app.services.evaluation_worker import EvaluationWorker
-from app.services.evaluator_service import evaluator_service
-from app.database import AsyncSessionLocal, test_async_connection
+from app.database import AsyncSessionLocal
 from app.models.experiment import ExperimentRun, RunStatus, Experiment, ExperimentStatus
-import pdb
+from app.models.evaluation import EvaluationResult
+from app.models.prompt import Prompt
+from app.models.dataset import Dataset
+from app.models.project import Project
+
+# Test experiment configs, built once at import rather than per test run
+_MODEL_CONFIG = {
+    "provider": "openai",
+    "model": "gpt-3.5-turbo",
+    "temperature": 0.7
+}
+_EVAL_CONFIG = {
+    "metrics": ["accuracy", "relevance"],
+    "thresholds": {"accuracy": 0.8}
+}
+
 
 class WorkerTester:
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.redis_url = settings.redis_url
         self.queue_service = RedisQueue()
-        self.db = AsyncSessionLocal()
-        self.worker = EvaluationWorker(self.db)
+        # Tests open their own short-lived sessions; the worker gets one in run_all_tests
+        self.worker = None
         self.test_results = {}
+        # Per-test output is buffered (and kept out of timed regions) unless verbose
+        self.verbose = verbose
+        self._log_buf: List[str] = []
         
+    def _out(self, message: str):
+        """Print immediately in verbose mode, otherwise buffer until flush_log"""
+        if self.verbose:
+            print(message)
+        else:
+            self._log_buf.append(message)
+
+    def flush_log(self):
+        """Write any buffered output in a single write"""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            sys.stdout.flush()
+            self._log_buf.clear()
+
     def log_test(self, test_name: str, success: bool, message: str = ""):
         """Log test result"""
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{test_name}: {status}")
+        self._out(f"{test_name}: {status}")
         if message:
-            print(f"   {message}")
+            self._out(f"   {message}")
         self.test_results[test_name] = success
         return success
 
     async def test_simple_evaluation_job(self) -> bool:
         """Test simple evaluation job processing"""
-        print("\n🔍 Testing simple evaluation job...")
+        self._out("\n🔍 Testing simple evaluation job...")
         
-        test_run = None
-        test_experiment = None
+        experiment_name = "Test Evaluation Experiment"
+        run_id = None
+        experiment_id = None
+        job_id = None
         try:
-            # Create a test experiment run record in the database
-            async with self.db as session:
-                # First create a test experiment
-                test_experiment = Experiment(
-                    name="Test Evaluation Experiment",
-                    description="Test experiment for worker testing",
-                    status=ExperimentStatus.ACTIVE,
-                    prompt_id=1,  # Assuming prompt ID 1 exists
-                    dataset_id=1,  # Assuming dataset ID 1 exists
-                    model_configuration={
-                        "provider": "openai",
-                        "model": "gpt-3.5-turbo",
-                        "temperature": 0.7
-                    },
-                    evaluation_config={
-                        "metrics": ["accuracy", "relevance"],
-                        "thresholds": {"accuracy": 0.8}
-                    },
-                    project_id=1  # Assuming project ID 1 exists
-                )
+            # Create a test experiment and run in one transaction; RETURNING hands back the IDs
+            async with AsyncSessionLocal() as session:
+                # Check the referenced prompt, dataset and project exist in one query
+                # before paying for inserts that would fail on the foreign keys
+                prompt_ok, dataset_ok, project_ok = (await session.execute(
+                    select(
+                        exists().where(Prompt.id == 1),
+                        exists().where(Dataset.id == 1),
+                        exists().where(Project.id == 1)
+                    )
+                )).one()
+                if not (prompt_ok and dataset_ok and project_ok):
+                    return self.log_test(
+                        "Simple Evaluation Job", False,
+                        f"Missing fixtures: prompt={prompt_ok}, dataset={dataset_ok}, project={project_ok}"
+                    )
                 
-                session.add(test_experiment)
-                await session.commit()
-                await session.refresh(test_experiment)
+                # First create a test experiment
+                experiment_id = (await session.execute(
+                    insert(Experiment).values(
+                        name=experiment_name,
+                        description="Test experiment for worker testing",
+                        status=ExperimentStatus.ACTIVE,
+                        prompt_id=1,  # Assuming prompt ID 1 exists
+                        dataset_id=1,  # Assuming dataset ID 1 exists
+                        model_configuration=_MODEL_CONFIG,
+                        evaluation_config=_EVAL_CONFIG,
+                        project_id=1  # Assuming project ID 1 exists
+                    ).returning(Experiment.id)
+                )).scalar_one()
                 
-                print(f"✅ Created test experiment: {test_experiment.name} (ID: {test_experiment.id})")
+                self._out(f"✅ Created test experiment: {experiment_name} (ID: {experiment_id})")
                 
-                # Create a test experiment run
-                test_run = ExperimentRun(
-                    id=str(uuid.uuid4()),
-                    status=RunStatus.PENDING,
-                    total_items=2,
-                    completed_items=0,
-                    failed_items=0,
-                    experiment_id=test_experiment.id
-                )
+                # Create a test experiment run; RETURNING reads back the ID from the column's gen_random_uuid() server default
+                run_id = (await session.execute(
+                    insert(ExperimentRun).values(
+                        status=RunStatus.PENDING,
+                        total_items=2,
+                        completed_items=0,
+                        failed_items=0,
+                        experiment_id=experiment_id
+                    ).returning(ExperimentRun.id)
+                )).scalar_one()
                 
-                session.add(test_run)
                 await session.commit()
-                await session.refresh(test_run)
                 
-                print(f"✅ Created experiment run: {test_run.id} (ID: {test_run.id})")
+                self._out(f"✅ Created experiment run: {run_id}")
                 
-                # Use the created run ID for the test job
-                job_id = str(uuid.uuid4())
+                # Use the created run ID for the test job; the queue assigns its job ID
                 test_job = {
-                    "job_id": job_id,
-                    "experiment_run_id": test_run.id,
+                    "experiment_run_id": run_id,
                     "evaluator_configs": [
                         {
                             "evaluator_type": "exact_match",
@@ -118,22 +150,20 @@ class WorkerTester:
                     ]
 
                 }
-                test_job["evaluator_configs"] = json.dumps(test_job["evaluator_configs"])
-                test_job['test_cases'] = json.dumps(test_job['test_cases'])
-                test_job['dataset_ids'] = json.dumps(test_job['dataset_ids'])
             
-            # Enqueue job
-            await self.queue_service.enqueue_job(test_job)
+            # Reserve the job for this worker in one round trip: it is stored (and gets its
+            # job ID) like any queued job, but never sits on the queue for another worker
+            job_id = await self.queue_service.reserve_job(test_job)
 
-            print(f"✅ Job enqueued: {job_id}")
+            self._out(f"✅ Job reserved: {job_id}")
             
             # Process job
             result = await self.worker.process_evaluation_job(test_job)
             
             if result and result.get("status") == "completed":
                 results = result.get("results", [])
-                print(f"✅ Job processed successfully: {len(results)} results")
-                print(f"✅ Job result: {result}")
+                self._out(f"✅ Job processed successfully: {len(results)} results")
+                self._out(f"✅ Job result: {result}")
                 return self.log_test("Simple Evaluation Job", True, f"Processed {len(results)} test cases")
             else:
                 return self.log_test("Simple Evaluation Job", False, f"Processing failed: {result}")
@@ -141,23 +171,31 @@ class WorkerTester:
         except Exception as e:
             return self.log_test("Simple Evaluation Job", False, f"Error: {e}")
         finally:
+            # Clean up: Delete the reserved job's Redis keys
+            if job_id:
+                try:
+                    await self.queue_service.delete_jobs([job_id])
+                except Exception as cleanup_error:
+                    self._out(f"⚠️  Failed to cleanup test job: {cleanup_error}")
+            
             # Clean up: Delete the test run and experiment records
-            if test_run or test_experiment:
+            if run_id or experiment_id:
                 try:
-                    async with self.db as session:
-                        if test_run:
-                            # Delete the test run
-                            await session.delete(test_run)
-                            print(f"✅ Cleaned up test run: {test_run.id}")
+                    async with AsyncSessionLocal() as session:
+                        # Plain DELETEs skip the ORM's load-then-delete; results go first
+                        # since the run's ORM cascade no longer removes them
+                        if run_id:
+                            await session.execute(delete(EvaluationResult).where(EvaluationResult.experiment_run_id == run_id))
+                            await session.execute(delete(ExperimentRun).where(ExperimentRun.id == run_id))
+                            self._out(f"✅ Cleaned up test run: {run_id}")
                         
-                        if test_experiment:
-                            # Delete the test experiment
-                            await session.delete(test_experiment)
-                            print(f"✅ Cleaned up test experiment: {test_experiment.name}")
+                        if experiment_id:
+                            await session.execute(delete(Experiment).where(Experiment.id == experiment_id))
+                            self._out(f"✅ Cleaned up test experiment: {experiment_name}")
                         
                         await session.commit()
                 except Exception as cleanup_error:
-                    print(f"⚠️  Failed to cleanup test data: {cleanup_error}")
+                    self._out(f"⚠️  Failed to cleanup test data: {cleanup_error}")
 
     async def run_all_tests(self) -> Dict[str, bool]:
         """Run all worker tests"""
@@ -171,8 +209,19 @@ class WorkerTester:
             self.test_simple_evaluation_job,
         ]
         
-        for test in tests:
-            await test()
+        try:
+            # One session and one HTTP client for the worker, held for the whole run;
+            # the worker shares the tester's Redis connection pool
+            async with AsyncSessionLocal() as db, EvaluationWorker(db, redis_client=self.queue_service.redis_client) as worker:
+                self.worker = worker
+                # Tests are I/O-bound and independent (each opens its own DB session), so overlap them
+                results = await asyncio.gather(*(test() for test in tests), return_exceptions=True)
+                for test, result in zip(tests, results):
+                    if isinstance(result, Exception):
+                        self.log_test(test.__name__, False, f"Error: {result}")
+        finally:
+            self.flush_log()
+            await self.queue_service.close()
         
         return self.test_results
 
@@ -182,7 +231,7 @@ class WorkerTester:
         print("📋 Worker Test Summary:")
         print("=" * 60)
         
-        passed = sum(1 for success in self.test_results.values() if success)
+        passed = list(self.test_results.values()).count(True)
         total = len(self.test_results)
         
         for test_name, success in self.test_results.items():
@@ -200,6 +249,14 @@ class WorkerTester:
             return False
 
 
+@pytest.mark.asyncio
+async def test_worker_suite():
+    """pytest entry point: run the WorkerTester suite and require every check to pass"""
+    tester = WorkerTester()
+    results = await tester.run_all_tests()
+    assert results and all(results.values()), results
+
+
 async def main():
     """Main function"""
     import argparse
@@ -217,7 +274,7 @@ async def main():
         settings.redis_url = args.redis_url
     
     # Create tester
-    tester = WorkerTester()
+    tester = WorkerTester(verbose=args.verbose)
     
     # Run tests
     results = await tester.run_all_tests()
@@ -230,4 +287,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use the libuv event loop when available (installed with uvicorn[standard]);
+    # only when run as a script, so importing this module under pytest leaves the loop policy alone
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main()) 
\ No newline at end of file
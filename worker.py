@@ -7,9 +7,23 @@ Run this to start the evaluation worker independently of the FastAPI app.
 import asyncio
 import signal
 import sys
+from functools import partial
 from app.database import AsyncSessionLocal
 from app.services.evaluation_worker import EvaluationWorker
 
+# Use the libuv event loop when available (installed with uvicorn[standard])
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
+def _schedule_stop(worker: EvaluationWorker):
+    """Signal callback: schedule the worker's shutdown on the running loop"""
+    print("\nReceived shutdown signal, stopping worker...")
+    asyncio.create_task(worker.stop())
+
 
 async def main():
     """Main worker function"""
@@ -19,13 +33,11 @@ async def main():
     async with AsyncSessionLocal() as db:
         worker = EvaluationWorker(db)
         
-        # Handle shutdown gracefully
-        def signal_handler(signum, frame):
-            print("\nReceived shutdown signal, stopping worker...")
-            asyncio.create_task(worker.stop())
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # Handle shutdown gracefully; loop signal handlers run inside the event loop
+        stop_cb = partial(_schedule_stop, worker)
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGINT, stop_cb)
+        loop.add_signal_handler(signal.SIGTERM, stop_cb)
         
         try:
             await worker.start()